@@ -1,14 +1,55 @@
+import functools
+import hashlib
+import re
 import textwrap
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partialmethod
 from manim import *
 from typing import Sequence
+from manim_devanagari.clusters import cluster_t2c, merge_cluster_lines, merge_clusters
+from manim_devanagari.draft import draft_placeholder, is_draft_mode
+from manim_devanagari.fonts import font_for_text
+from manim_devanagari.freeze import Freezable, FreezableScene
+from manim_devanagari.lod import simplify_curves
+from manim_devanagari.validation import (
+    TexValidationError,
+    normalize_tex,
+    normalize_tex_strings,
+    validate_tex,
+)
+
 
 # Define a custom TexTemplate for Devanagari script
-_Devanagari = TexTemplate(
-    tex_compiler="xelatex",
-    output_format=".xdv",
-    documentclass="\\documentclass[preview]{standalone}",
-    preamble="\\usepackage{fontspec}\n\\usepackage{polyglossia}\n\\usepackage{cancel}\n\\setmainlanguage{english}\n\\setotherlanguage{hindi}\\setmainfont[Script=Devanagari]{Noto Sans}\n\\usepackage{amsmath}\n\\usepackage{amssymb}",
-)
+@functools.lru_cache(maxsize=None)
+def _devanagari_template(font: str = "Noto Sans") -> TexTemplate:
+    """
+    Returns the xelatex template for Devanagari, with the given main font.
+
+    Args:
+        font (str): The main font family. Defaults to "Noto Sans".
+
+    Returns:
+        TexTemplate: The template, built once per font.
+    """
+    return TexTemplate(
+        tex_compiler="xelatex",
+        output_format=".xdv",
+        documentclass="\\documentclass[preview]{standalone}",
+        preamble="\\usepackage{fontspec}\n\\usepackage{polyglossia}\n\\usepackage{cancel}\n\\setmainlanguage{english}\n\\setotherlanguage{hindi}\\setmainfont[Script=Devanagari]{%s}\n\\usepackage{amsmath}\n\\usepackage{amssymb}"
+        % font,
+    )
+
+
+def _tex_font_template(tex_strings: Sequence[str]) -> TexTemplate:
+    # TeX commands are ASCII, so only the other characters decide the font.
+    text = "".join(s for s in tex_strings if isinstance(s, str))
+    text = "".join(char for char in text if not char.isascii())
+    return _devanagari_template(font_for_text(text, "Noto Sans"))
+
+
+_Devanagari = _devanagari_template()
 
 
 def Footer(
@@ -49,7 +90,47 @@ def Footer(
     return footer
 
 
-class Paragraph(Paragraph):
+def _set_cluster_tags(text: str, kwargs: dict) -> ManimColor:
+    """
+    Replaces the colour arguments in ``kwargs`` with per-cluster tag colours.
+
+    Args:
+        text (str): The text as it will be passed to Pango.
+        kwargs (dict): Keyword arguments for the Text class, updated in place.
+
+    Returns:
+        ManimColor: The colour to apply once the clusters are merged.
+
+    Raises:
+        ValueError: If per-character colours or gradients were requested too.
+    """
+    for key in ("t2c", "text2color", "t2g", "text2gradient", "gradient"):
+        if kwargs.get(key):
+            raise ValueError(f"group_clusters cannot be combined with {key}")
+    color = kwargs.pop("color", None)
+    kwargs["t2c"] = cluster_t2c(text)
+    return ManimColor(color) if color else VMobject().color
+
+
+def _normalize_tex_input(
+    tex_strings: Sequence[str], kwargs: dict, arg_separator: str
+) -> tuple[str, ...]:
+    # Substrings that refer to the fragments must be normalized the same way.
+    if kwargs.get("substrings_to_isolate"):
+        kwargs["substrings_to_isolate"] = [
+            normalize_tex(substring) for substring in kwargs["substrings_to_isolate"]
+        ]
+    if kwargs.get("tex_to_color_map"):
+        kwargs["tex_to_color_map"] = {
+            normalize_tex(substring): color
+            for substring, color in kwargs["tex_to_color_map"].items()
+        }
+    return normalize_tex_strings(
+        tex_strings, kwargs.get("arg_separator", arg_separator)
+    )
+
+
+class Paragraph(Freezable, Paragraph):
     """
     Custom Paragraph class that wraps text and allows for alignment.
 
@@ -59,24 +140,53 @@ class Paragraph(Paragraph):
         wrap_width (int): The width for wrapping text. Defaults to 50.
         align (str): The alignment of the text. Defaults to "l" (left).
         direction_align (str | None): Optional direction alignment. Defaults to None.
+        lod_tolerance (float | None): If set, simplify the curves to this tolerance
+            in output pixels (level of detail). Defaults to None.
+        group_clusters (bool): Whether to merge glyphs into one submobject per
+            grapheme cluster in every line. Defaults to False.
+
+    Attributes:
+        source (str): The lines it was built from, joined by newlines.
     """
 
+    kind = "paragraph"
+
     def __init__(
         self,
         *text: Sequence[str],
         wrap: bool = True,
         wrap_width: int = config.pixel_width,
         align: str = "l",
+        lod_tolerance: float | None = None,
+        group_clusters: bool = False,
         **kwargs,
     ):
         self.wrap = wrap
         self.wrap_width = wrap_width
         self.align = kwargs.get("alignment", align)
+        self.source = "\n".join(text)
         self.original_text = map(self.wrap_text, text)
+        if group_clusters:
+            self.original_text = list(self.original_text)
+            color = _set_cluster_tags("\n".join(self.original_text), kwargs)
         super().__init__(
             *self.original_text,
             **kwargs,
         )
+        if group_clusters:
+            # Lines are rebuilt from the merged clusters, since manim splits them
+            # by code point count and can cut an akshara in two.
+            lines = merge_cluster_lines(
+                "\n".join(self.original_text), self.lines_text.submobjects
+            )
+            for line, clusters in zip(self.submobjects, lines):
+                line.submobjects = clusters
+            self.lines_initial_positions = [
+                line.get_center() for line in self.submobjects
+            ]
+            self.set_color(color)
+        if lod_tolerance is not None:
+            simplify_curves(self, lod_tolerance)
 
     def wrap_text(self, text: str) -> str:
         """
@@ -105,7 +215,7 @@ class Paragraph(Paragraph):
         )
 
 
-class Text(Text):
+class Text(Freezable, Text):
     """
     Custom Text class that allows for alignment options.
 
@@ -113,19 +223,40 @@ class Text(Text):
         text (str): The text to display.
         align (str): The alignment of the text. Defaults to "l" (left).
         direction_align (str | None): Optional direction alignment. Defaults to None.
+        lod_tolerance (float | None): If set, simplify the curves to this tolerance
+            in output pixels (level of detail). Defaults to None.
+        group_clusters (bool): Whether to merge glyphs into one submobject per
+            grapheme cluster (akshara). Defaults to False.
+
+    Attributes:
+        source (str): The text it was built from.
     """
 
+    kind = "text"
+
     def __init__(
         self,
         text: str,
         align: str = "l",
+        lod_tolerance: float | None = None,
+        group_clusters: bool = False,
         **kwargs,
     ):
         self.align = align
+        self.source = text
+        if group_clusters:
+            tab_width = kwargs.get("tab_width", 4)
+            color = _set_cluster_tags(text.replace("\t", " " * tab_width), kwargs)
         super().__init__(text=text, **kwargs)
+        if group_clusters:
+            self.submobjects = merge_clusters(self.submobjects)
+            self.chars = self.get_group_class()(*self.submobjects)
+            self.set_color(color)
+        if lod_tolerance is not None:
+            simplify_curves(self, lod_tolerance)
 
 
-class MarkupText(MarkupText):
+class MarkupText(Freezable, MarkupText):
     """
     Custom MarkupText class that allows for alignment options.
 
@@ -133,19 +264,30 @@ class MarkupText(MarkupText):
         text (str): The text to display.
         align (str): The alignment of the text. Defaults to "l" (left).
         direction_align (str | None): Optional direction alignment. Defaults to None.
+        lod_tolerance (float | None): If set, simplify the curves to this tolerance
+            in output pixels (level of detail). Defaults to None.
+
+    Attributes:
+        source (str): The markup it was built from.
     """
 
+    kind = "markup"
+
     def __init__(
         self,
         text: str,
         align: str = "l",
+        lod_tolerance: float | None = None,
         **kwargs,
     ):
         self.align = align
+        self.source = text
         super().__init__(text, **kwargs)
+        if lod_tolerance is not None:
+            simplify_curves(self, lod_tolerance)
 
 
-class Tex(Tex):
+class Tex(Freezable, Tex):
     """
     Custom Tex class that allows for alignment options.
 
@@ -153,20 +295,45 @@ class Tex(Tex):
         tex_strings (str): The LaTeX strings to display.
         align (str): The alignment of the text. Defaults to "l" (left).
         direction_align (str | None): Optional direction alignment. Defaults to None.
+        lod_tolerance (float | None): If set, simplify the curves to this tolerance
+            in output pixels (level of detail). Defaults to None.
+
+    Attributes:
+        source (str): The TeX string it was built from.
+
+    Raises:
+        TexValidationError: If the joined TeX string fails the pre-flight check.
     """
 
+    kind = "tex"
+
     def __init__(
         self,
         *tex_strings,
         align: str = "l",
         tex_environment="flushleft",
+        lod_tolerance: float | None = None,
         **kwargs,
     ):
         self.align = align
+        tex_strings = _normalize_tex_input(tex_strings, kwargs, "")
+        self.source = validate_tex(
+            tex_strings,
+            tex_template=kwargs.get("tex_template", config.tex_template),
+            arg_separator=kwargs.get("arg_separator", ""),
+        )
         super().__init__(*tex_strings, tex_environment=tex_environment, **kwargs)
+        if lod_tolerance is not None:
+            simplify_curves(self, lod_tolerance)
+
+    def get_parts_by_tex(self, tex, substring=True, case_sensitive=True):
+        # The fragments are stored normalized, so the query has to be as well.
+        return super().get_parts_by_tex(
+            normalize_tex(tex), substring=substring, case_sensitive=case_sensitive
+        )
 
 
-class MathTex(MathTex):
+class MathTex(Freezable, MathTex):
     """
     Custom MathTex class that allows for alignment options.
 
@@ -174,15 +341,47 @@ class MathTex(MathTex):
         tex_strings (str): The LaTeX strings to display.
         align (str): The alignment of the text. Defaults to "l" (left).
         direction_align (str | None): Optional direction alignment. Defaults to None.
+        lod_tolerance (float | None): If set, simplify the curves to this tolerance
+            in output pixels (level of detail). Defaults to None.
+
+    Attributes:
+        source (str): The TeX string it was built from.
+
+    Raises:
+        TexValidationError: If the joined TeX string fails the pre-flight check.
     """
 
-    def __init__(self, *tex_strings, align: str = "l", **kwargs):
+    kind = "math"
+
+    def __init__(
+        self,
+        *tex_strings,
+        align: str = "l",
+        lod_tolerance: float | None = None,
+        **kwargs,
+    ):
 
         self.align = align
+        tex_strings = _normalize_tex_input(tex_strings, kwargs, " ")
+        self.source = validate_tex(
+            tex_strings,
+            tex_template=kwargs.get("tex_template", config.tex_template),
+            arg_separator=kwargs.get("arg_separator", " "),
+        )
         super().__init__(*tex_strings, **kwargs)
+        if lod_tolerance is not None:
+            simplify_curves(self, lod_tolerance)
+
+    def get_parts_by_tex(self, tex, substring=True, case_sensitive=True):
+        # The fragments are stored normalized, so the query has to be as well.
+        return super().get_parts_by_tex(
+            normalize_tex(tex), substring=substring, case_sensitive=case_sensitive
+        )
 
 
 class MathTex_Display(MathTex):
+    kind = "math_display"
+
     def __init__(self, *tex_strings, **kwargs):
         super().__init__(*tex_strings, **kwargs)
 
@@ -199,7 +398,7 @@ class Deva_Tex(Tex):
     """
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, tex_template=_Devanagari, **kwargs)
+        super().__init__(*args, tex_template=_tex_font_template(args), **kwargs)
 
 
 class Deva_MathTex(MathTex):
@@ -214,10 +413,12 @@ class Deva_MathTex(MathTex):
     """
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, tex_template=_Devanagari, **kwargs)
+        super().__init__(*args, tex_template=_tex_font_template(args), **kwargs)
 
 
 class Deva_MathTex_Display(Deva_MathTex):
+    kind = "math_display"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -234,7 +435,7 @@ class Deva_Text(Text):
     """
 
     def __init__(self, text: str, font="Noto Sans", **kwargs):
-        super().__init__(text, font=font, **kwargs)
+        super().__init__(text, font=font_for_text(text, font), **kwargs)
 
 
 class Deva_MarkupText(MarkupText):
@@ -251,12 +452,13 @@ class Deva_MarkupText(MarkupText):
     """
 
     def __init__(self, text: str, font="Noto Sans", **kwargs):
-        super().__init__(text, font=font, **kwargs)
+        plain_text = re.sub(r"<[^>]*>", "", text)
+        super().__init__(text, font=font_for_text(plain_text, font), **kwargs)
 
 
 class Deva_Paragraph(Paragraph):
     def __init__(self, *text: Sequence[str], font="Noto Sans", **kwargs):
-        super().__init__(*text, font=font, **kwargs)
+        super().__init__(*text, font=font_for_text("".join(text), font), **kwargs)
 
 
 class QuestionText(Text):
@@ -275,6 +477,8 @@ class QuestionText(Text):
         self.add(question)
     """
 
+    kind = "question"
+
     def __init__(
         self,
         question_no: int,
@@ -331,6 +535,8 @@ class AnswerText(Text):
         self.add(answer)
     """
 
+    kind = "answer"
+
     def __init__(
         self,
         lang="en",
@@ -379,6 +585,8 @@ class SolutionText(Text):
         self.add(solution)
     """
 
+    kind = "solution"
+
     def __init__(
         self,
         lang="en",
@@ -442,6 +650,76 @@ class Cancel(VGroup):
         self.set_stroke(color=stroke_color, width=stroke_width)
 
 
+class CancelGroup(VMobject):
+    """Custom VMobject class for cancelling many mobjects at once.
+
+    All cancel lines are built in one vectorized pass as the subpaths of a single
+    VMobject, so styling, transforming and rendering them costs the same as one line.
+
+    Args:
+        *mobjects (Mobject | tuple[Mobject, int | slice | range]): The mobjects to be
+            canceled. A ``(mobject, index)`` pair cancels ``mobject[index]``, e.g.
+            ``(math_tex[0], range(2, 5))`` cancels a range of glyphs of a MathTex.
+        stroke_color (Color): The color of the cancel lines. Default is RED.
+        stroke_width (float): The width of the cancel lines. Default is 2.0.
+        scale_factor (float): The scale factor for the cancel effect. Default is 1.5.
+        **kwargs: Additional keyword arguments for the VMobject class.
+
+    Example:
+        strikes = CancelGroup(tex[0], tex[3], (tex[1], range(0, 3)))
+        self.play(Create(strikes.get_strikes(0, 1)))
+    """
+
+    def __init__(
+        self,
+        *mobjects: Mobject | tuple[Mobject, int | slice | range],
+        stroke_color: ParsableManimColor = RED,
+        stroke_width: float = 2.0,
+        scale_factor: float = 1.5,
+        **kwargs,
+    ) -> None:
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+        bounds = np.array([self._get_bounds(mobject) for mobject in mobjects])
+        self.set_points(self._strike_points(bounds.reshape(-1, 2, 3), scale_factor))
+
+    @staticmethod
+    def _get_bounds(mobject) -> np.ndarray:
+        if isinstance(mobject, tuple):
+            mobject, index = mobject
+            if isinstance(index, range):
+                index = slice(index.start, index.stop, index.step)
+            mobject = mobject[index]
+        points = mobject.get_all_points()
+        if len(points) == 0:
+            return np.array([mobject.get_center()] * 2)
+        return np.array([points.min(axis=0), points.max(axis=0)])
+
+    @staticmethod
+    def _strike_points(bounds: np.ndarray, scale_factor: float) -> np.ndarray:
+        center = bounds.mean(axis=1)
+        half_size = (bounds[:, 1] - bounds[:, 0]) * scale_factor / 2
+        half_size[:, 2] = 0
+        start = center + half_size
+        end = center - half_size
+        alphas = np.linspace(0, 1, 4)[None, :, None]
+        return (start[:, None] + alphas * (end - start)[:, None]).reshape(-1, 3)
+
+    def get_strikes(self, *indices: int) -> "CancelGroup":
+        """
+        Returns a copy holding only the given cancel lines, e.g. to animate a subset.
+
+        Args:
+            *indices (int): Indices of the cancel lines, in the order they were given.
+
+        Returns:
+            CancelGroup: The cancel lines at the given indices.
+        """
+        strikes = self.copy()
+        points = self.points.reshape(-1, 4, 3)
+        strikes.set_points(points[list(indices)].reshape(-1, 3))
+        return strikes
+
+
 class BoldTex(Tex):
     def __init__(self, *tex_strings, **kwargs):
         self.tex_string_original = " ".join(tex_strings)
@@ -469,7 +747,202 @@ class BoldMath(MathTex):
         return tuple(tex_strings)
 
 
-class Themes(Scene):
+@dataclass(frozen=True)
+class Theme:
+    """
+    An immutable theme preset, compiled once into per-class default arguments.
+
+    Equal presets share one compiled instance, so applying a preset that is already
+    active costs nothing and switching presets is a handful of attribute swaps.
+
+    Args:
+        background_color (Color): The background color. Defaults to BLACK.
+        font (str): The font for Text, Paragraph and MarkupText. Defaults to "sans-serif".
+        font_size (float): The font size for all text classes. Defaults to DEFAULT_FONT_SIZE.
+        footer_color (Color): The fill color of the footer. Defaults to WHITE.
+
+    Example:
+        LIGHT = Theme(background_color=WHITE)
+        use_theme(LIGHT)
+    """
+
+    background_color: ParsableManimColor = "#000000"
+    font: str = "sans-serif"
+    font_size: float = DEFAULT_FONT_SIZE
+    footer_color: ParsableManimColor = "#FFFFFF"
+
+    def __post_init__(self):
+        # Colors are stored as hex strings so that the preset is hashable.
+        for field in ("background_color", "footer_color"):
+            object.__setattr__(self, field, ManimColor(getattr(self, field)).to_hex())
+
+    @functools.cached_property
+    def defaults(self) -> dict[type, dict]:
+        """dict[type, dict]: The default arguments this preset gives each class."""
+        color = {"color": BLACK} if self.background_color == WHITE.to_hex() else {}
+        text = {**color, "font": self.font, "font_size": self.font_size}
+        tex = {**color, "font_size": self.font_size}
+        return {
+            Text: text,
+            Paragraph: text,
+            MarkupText: text,
+            Tex: tex,
+            MathTex: tex,
+            Deva_Tex: tex,
+            Deva_MathTex: tex,
+            Deva_MarkupText: text,
+        }
+
+    @functools.cached_property
+    def _initializers(self) -> dict[type, partialmethod]:
+        return {
+            cls: partialmethod(cls._original__init__, **kwargs)
+            for cls, kwargs in self.defaults.items()
+        }
+
+    def style_key(self, cls: type) -> str:
+        """
+        Returns a hash of the defaults this preset gives a class and its bases.
+
+        Args:
+            cls (type): The mobject class.
+
+        Returns:
+            str: A key that only changes when the class's themed style changes.
+        """
+        style = {}
+        for base in reversed(cls.__mro__):
+            style.update(self.defaults.get(base, {}))
+        return hashlib.sha1(repr(sorted(style.items())).encode()).hexdigest()
+
+    def get_footer(self, width: float) -> Rectangle:
+        """
+        Returns a copy of the preset's footer for the given width.
+
+        Args:
+            width (float): The width of the footer.
+
+        Returns:
+            Rectangle: The footer rectangle object.
+        """
+        footers = self.__dict__.setdefault("_footers", {})
+        if width not in footers:
+            footers[width] = Footer(width=width, fill_color=self.footer_color)
+        return footers[width].copy()
+
+
+_THEMES: dict[Theme, Theme] = {}
+_ACTIVE_THEME: Theme | None = None
+_MOBJECT_CACHE: OrderedDict[tuple, Mobject] = OrderedDict()
+_MOBJECT_CACHE_SIZE = 256
+_MOBJECT_CACHE_LOCK = threading.Lock()
+
+
+def use_theme(theme: Theme) -> Theme:
+    """
+    Makes a theme preset the active one.
+
+    Args:
+        theme (Theme): The preset to apply.
+
+    Returns:
+        Theme: The compiled preset that is now active.
+    """
+    global _ACTIVE_THEME
+    theme = _THEMES.setdefault(theme, theme)
+    if theme is not _ACTIVE_THEME:
+        for cls, initializer in theme._initializers.items():
+            cls.__init__ = initializer
+        _ACTIVE_THEME = theme
+    return theme
+
+
+def style_key(cls: type) -> str:
+    """
+    Returns the active theme's style key for a class, for use in cache keys.
+
+    Args:
+        cls (type): The mobject class.
+
+    Returns:
+        str: The style key, or an empty string if no theme is active.
+    """
+    return _ACTIVE_THEME.style_key(cls) if _ACTIVE_THEME is not None else ""
+
+
+def cached_mobject(cls: type, *args, **kwargs) -> Mobject:
+    """
+    Builds a mobject once per class, arguments and themed style, and returns copies.
+
+    The most recently used ``_MOBJECT_CACHE_SIZE`` mobjects are kept.
+
+    TeX fragments are normalized first, so cosmetic variants of one expression
+    share a single build. In draft mode, TeX that is not cached yet is built in
+    the background and a placeholder of the estimated size is returned instead.
+
+    Args:
+        cls (type): The mobject class.
+        *args: Positional arguments for the class.
+        **kwargs: Keyword arguments for the class.
+
+    Returns:
+        Mobject: A copy of the cached mobject.
+    """
+    if issubclass(cls, SingleStringMathTex):
+        arg_separator = kwargs.get("arg_separator", "" if issubclass(cls, Tex) else " ")
+        args = normalize_tex_strings(args, arg_separator)
+    key = (cls, args, tuple(sorted(kwargs.items())), style_key(cls))
+    try:
+        with _MOBJECT_CACHE_LOCK:
+            mobject = _MOBJECT_CACHE.get(key)
+            if mobject is not None:
+                _MOBJECT_CACHE.move_to_end(key)
+    except TypeError:
+        return cls(*args, **kwargs)
+    if mobject is None:
+
+        def build():
+            mobject = cls(*args, **kwargs)
+            # Copies carry the id, so dropping one can evict the original.
+            mobject.cache_id = id(mobject)
+            # Draft builds run on a thread pool, hence the lock.
+            with _MOBJECT_CACHE_LOCK:
+                _MOBJECT_CACHE[key] = mobject
+                while len(_MOBJECT_CACHE) > _MOBJECT_CACHE_SIZE:
+                    _MOBJECT_CACHE.popitem(last=False)
+            return mobject
+
+        if is_draft_mode() and issubclass(cls, SingleStringMathTex):
+            font_size = kwargs.get(
+                "font_size",
+                DEFAULT_FONT_SIZE if _ACTIVE_THEME is None else _ACTIVE_THEME.font_size,
+            )
+            return draft_placeholder(
+                key,
+                build,
+                args,
+                font_size,
+                arg_separator=arg_separator,
+                kind=getattr(cls, "kind", None),
+            )
+        mobject = build()
+    return mobject.copy()
+
+
+def uncache_mobject(cache_id: int | None) -> None:
+    """
+    Evicts a mobject built by :func:`cached_mobject` from the cache.
+
+    Args:
+        cache_id (int | None): The ``cache_id`` of the mobject or one of its copies.
+    """
+    with _MOBJECT_CACHE_LOCK:
+        for key, mobject in list(_MOBJECT_CACHE.items()):
+            if id(mobject) == cache_id:
+                del _MOBJECT_CACHE[key]
+
+
+class Themes(FreezableScene):
     def set_theme(
         self,
         background_color=BLACK,
@@ -477,28 +950,13 @@ class Themes(Scene):
         font_size=DEFAULT_FONT_SIZE,
         set_footer=True,
         footer_color=WHITE,
+        theme: Theme | None = None,
     ):
-        self.Footer = Footer(width=self.camera.frame_width, fill_color=footer_color)
+        if theme is None:
+            theme = Theme(background_color, font, font_size, footer_color)
+        theme = use_theme(theme)
+        self.theme = theme
+        self.camera.background_color = theme.background_color
+        self.Footer = theme.get_footer(self.camera.frame_width)
         if set_footer:
             self.add(self.Footer)
-        match str(background_color):
-            case "#FFFFFF":
-                self.camera.background_color = background_color
-                _COLOR = BLACK
-                Text.set_default(color=_COLOR)
-                Paragraph.set_default(color=_COLOR)
-                MarkupText.set_default(color=_COLOR)
-                Tex.set_default(color=_COLOR)
-                MathTex.set_default(color=_COLOR)
-                Deva_Tex.set_default(color=_COLOR)
-                Deva_MathTex.set_default(color=_COLOR)
-                Deva_MarkupText.set_default(color=_COLOR)
-
-        Text.set_default(font=font, font_size=font_size)
-        Paragraph.set_default(font=font, font_size=font_size)
-        MarkupText.set_default(font=font, font_size=font_size)
-        Tex.set_default(font_size=font_size)
-        MathTex.set_default(font_size=font_size)
-        Deva_Tex.set_default(font_size=font_size)
-        Deva_MathTex.set_default(font_size=font_size)
-        Deva_MarkupText.set_default(font=font, font_size=font_size)
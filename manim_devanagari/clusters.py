@@ -0,0 +1,121 @@
+import re
+from manim import *
+from typing import Sequence
+
+"""
+This module groups the glyph submobjects of a text mobject into one submobject per
+grapheme cluster (akshara), so that animations run over whole syllables.
+"""
+
+_CONSONANT = "\u0915-\u0939\u0958-\u095f\u0978-\u097f"
+_VOWEL = "\u0904-\u0914\u0960\u0961\u0972-\u0977"
+_MARK = "\u0900-\u0903\u093a-\u094c\u094e\u094f\u0951-\u0957\u0962\u0963"
+_NUKTA = "\u093c"
+_VIRAMA = "\u094d"
+_JOINER = "\u200c\u200d"
+
+_CLUSTER_RE = re.compile(
+    f"(?:[{_CONSONANT}]{_NUKTA}?{_VIRAMA}[{_JOINER}]?)*"
+    f"[{_CONSONANT}][{_MARK}{_VIRAMA}{_JOINER}]*"
+    f"|[{_VOWEL}][{_MARK}]*"
+    f"|.[{_MARK}]*",
+    re.DOTALL,
+)
+
+# Cluster tags are encoded in the glyph fill colour in steps of four per channel,
+# which survives the round trip through Pango's SVG output.
+_TAG_STEP = 4
+_TAG_BASE = 256 // _TAG_STEP
+
+
+def grapheme_clusters(text: str) -> list[tuple[int, int]]:
+    """
+    Splits text into grapheme clusters (aksharas for Devanagari).
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list[tuple[int, int]]: The ``(start, end)`` span of every cluster.
+
+    Example:
+        grapheme_clusters("क्षमा")  # [(0, 3), (3, 5)]
+    """
+    return [match.span() for match in _CLUSTER_RE.finditer(text)]
+
+
+def _tag_to_color(tag: int) -> str:
+    channels = [(tag // _TAG_BASE**i) % _TAG_BASE * _TAG_STEP for i in range(3)]
+    return "#{:02X}{:02X}{:02X}".format(*channels)
+
+
+def _color_to_tag(mobject: VMobject) -> int:
+    channels = np.round(mobject.get_fill_rgbas()[0][:3] * 255 / _TAG_STEP)
+    return int(sum(int(c) * _TAG_BASE**i for i, c in enumerate(channels)))
+
+
+def cluster_t2c(text: str) -> dict[str, str]:
+    """
+    Builds a ``t2c`` mapping that gives every grapheme cluster its own tag colour.
+
+    Pango shapes and colours whole clusters, so after rendering the fill colour of
+    each glyph tells which cluster it belongs to.
+
+    Args:
+        text (str): The text that will be rendered.
+
+    Returns:
+        dict[str, str]: Slice keys such as ``"[0:3]"`` mapped to tag colours.
+    """
+    return {
+        f"[{start}:{end}]": _tag_to_color(tag)
+        for tag, (start, end) in enumerate(grapheme_clusters(text))
+        if not text[start:end].isspace()
+    }
+
+
+def merge_clusters(glyphs: Sequence[VMobject]) -> list[VMobject]:
+    """
+    Merges glyphs rendered with :func:`cluster_t2c` into one VMobject per cluster.
+
+    Args:
+        glyphs (Sequence[VMobject]): Glyph submobjects carrying tag colours.
+
+    Returns:
+        list[VMobject]: One submobject per cluster, in text order.
+    """
+    clusters = {}
+    for glyph in glyphs:
+        clusters.setdefault(_color_to_tag(glyph), []).append(glyph)
+    merged = []
+    for tag in sorted(clusters):
+        first, *rest = clusters[tag]
+        for glyph in rest:
+            first.append_points(glyph.points)
+        merged.append(first)
+    return merged
+
+
+def merge_cluster_lines(text: str, glyphs: Sequence[VMobject]) -> list[list[VMobject]]:
+    """
+    Merges glyphs rendered with :func:`cluster_t2c` and splits the clusters by line.
+
+    Lines are found from the clusters' positions in the text, so a cluster is
+    never split across two lines.
+
+    Args:
+        text (str): The text that was rendered, with lines separated by newlines.
+        glyphs (Sequence[VMobject]): Glyph submobjects carrying tag colours.
+
+    Returns:
+        list[list[VMobject]]: The clusters of every line, in text order.
+    """
+    line_of_tag = []
+    line = 0
+    for start, end in grapheme_clusters(text):
+        line_of_tag.append(line)
+        line += text.count("\n", start, end)
+    lines = [[] for _ in range(line + 1)]
+    for cluster in merge_clusters(glyphs):
+        lines[line_of_tag[_color_to_tag(cluster)]].append(cluster)
+    return lines
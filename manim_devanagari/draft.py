@@ -0,0 +1,319 @@
+import copy
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from manim import *
+from pathlib import Path
+from typing import Sequence
+from manim_devanagari.freeze import FreezableScene
+
+"""
+This module provides a draft preview mode for fast authoring in notebooks: scenes
+render only their final frame (or chosen key frames) at low resolution, and TeX
+entries that are not cached yet are drawn as placeholder boxes while they compile
+in the background.
+"""
+
+DRAFT_CONFIG = {
+    "pixel_height": 270,
+    "frame_rate": 15,
+    "save_last_frame": True,
+    "write_to_movie": False,
+}
+
+_SAVED_CONFIG: dict | None = None
+_OVERRIDES: dict = {}
+_EXECUTOR: ThreadPoolExecutor | None = None
+_PENDING: dict[tuple, Future] = {}
+
+_TEX_COMMAND_RE = re.compile(r"\\[a-zA-Z]+\*?")
+_TEX_SKIP_RE = re.compile(r"[{}^_&$]")
+
+
+def set_draft_mode(enabled: bool = True, **overrides) -> None:
+    """
+    Turns draft mode on or off for the session.
+
+    Args:
+        enabled (bool): Whether draft mode is on. Defaults to True.
+        **overrides: Config values to use instead of :data:`DRAFT_CONFIG`, such
+            as ``pixel_height=360``.
+
+    Example:
+        set_draft_mode()
+        %manim -v WARNING Chapter1
+        set_draft_mode(False)
+    """
+    global _SAVED_CONFIG, _OVERRIDES
+    if enabled:
+        draft = {**DRAFT_CONFIG, **overrides}
+        if _SAVED_CONFIG is None:
+            _SAVED_CONFIG = {}
+        for key in [*draft, "pixel_width"]:
+            _SAVED_CONFIG.setdefault(key, config[key])
+        _OVERRIDES = overrides
+        for key, value in draft.items():
+            config[key] = value
+        config.pixel_width = round(
+            config.pixel_height * config.frame_width / config.frame_height
+        )
+    elif _SAVED_CONFIG is not None:
+        for key, value in _SAVED_CONFIG.items():
+            config[key] = value
+        _SAVED_CONFIG = None
+        _OVERRIDES = {}
+
+
+def get_draft_state() -> tuple[dict | None, dict]:
+    """
+    Returns the session's draft state, for :func:`set_draft_state`.
+
+    Returns:
+        tuple[dict | None, dict]: The config saved when draft mode was turned on
+        (None if it is off) and the overrides it was turned on with.
+    """
+    saved = None if _SAVED_CONFIG is None else dict(_SAVED_CONFIG)
+    return saved, dict(_OVERRIDES)
+
+
+def set_draft_state(state: tuple[dict | None, dict]) -> None:
+    """
+    Restores a draft state returned by :func:`get_draft_state`.
+
+    Args:
+        state (tuple[dict | None, dict]): The saved config and the overrides.
+    """
+    global _SAVED_CONFIG
+    saved, overrides = state
+    set_draft_mode(False)
+    if saved is not None:
+        set_draft_mode(True, **overrides)
+        _SAVED_CONFIG = dict(saved)
+
+
+def is_draft_mode() -> bool:
+    """
+    Returns whether draft mode is on.
+
+    Returns:
+        bool: True between ``set_draft_mode()`` and ``set_draft_mode(False)``.
+    """
+    return _SAVED_CONFIG is not None
+
+
+def estimate_tex_size(
+    tex_strings: Sequence[str], font_size: float = DEFAULT_FONT_SIZE
+) -> tuple[float, float]:
+    """
+    Estimates the size of compiled TeX without compiling it.
+
+    Args:
+        tex_strings (Sequence[str]): The TeX fragments.
+        font_size (float): The font size the TeX will be rendered at.
+
+    Returns:
+        tuple[float, float]: The estimated width and height, in scene units.
+    """
+    tex = "".join(text for text in tex_strings if isinstance(text, str))
+    lines = tex.split(r"\\")
+    # Every command counts as one character, grouping and alignment as none.
+    longest = max(
+        len(" ".join(_TEX_SKIP_RE.sub("", _TEX_COMMAND_RE.sub("x", line)).split()))
+        for line in lines
+    )
+    scale = font_size / DEFAULT_FONT_SIZE
+    return max(longest, 1) * 0.3 * scale, len(lines) * 0.55 * scale
+
+
+class DraftPlaceholder(Rectangle):
+    """
+    A box standing in for a mobject that is still being built in the background.
+
+    Args:
+        pending (Future): The background build of the real mobject.
+        width (float): The estimated width of the real mobject.
+        height (float): The estimated height of the real mobject.
+        source (str | None): The source string of the real mobject.
+        kind (str | None): The kind of the real mobject.
+    """
+
+    def __init__(
+        self,
+        pending: Future,
+        width: float,
+        height: float,
+        source: str | None = None,
+        kind: str | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            width=width,
+            height=height,
+            color=GREY,
+            stroke_width=1,
+            fill_opacity=0.15,
+            **kwargs,
+        )
+        self.pending = pending
+        self.source = source
+        self.kind = kind
+
+    def __deepcopy__(self, memo):
+        # A Future holds a lock and cannot be copied; copies share the build.
+        result = type(self).__new__(type(self))
+        memo[id(self)] = result
+        for attr, value in self.__dict__.items():
+            result.__dict__[attr] = (
+                value if attr == "pending" else copy.deepcopy(value, memo)
+            )
+        return result
+
+    def swap_if_ready(self) -> bool:
+        """
+        Becomes the real mobject if its background build has finished.
+
+        The real mobject is placed with its left edge on the placeholder's left
+        edge, so notebook layout is kept.
+
+        Returns:
+            bool: True if the placeholder was swapped.
+        """
+        if self.pending is None or not self.pending.done():
+            return False
+        pending, self.pending = self.pending, None
+        try:
+            mobject = pending.result().copy()
+        except Exception as error:
+            logger.error(f"Draft build failed: {error}")
+            self.set_stroke(RED)
+            return False
+        mobject.move_to(self, aligned_edge=LEFT)
+        self.become(mobject)
+        # become only copies points and style, not what the mobject was built from.
+        for attr in ("source", "kind", "cache_id"):
+            setattr(self, attr, getattr(mobject, attr, None))
+        return True
+
+
+def draft_placeholder(
+    key: tuple,
+    build,
+    tex_strings: Sequence[str],
+    font_size: float,
+    arg_separator: str = "",
+    kind: str | None = None,
+) -> DraftPlaceholder:
+    """
+    Starts building a TeX mobject in the background and returns a placeholder.
+
+    Args:
+        key (tuple): The cache key of the mobject. Builds are shared per key.
+        build (Callable[[], Mobject]): Builds and caches the real mobject.
+        tex_strings (Sequence[str]): The TeX fragments, used to estimate the size.
+        font_size (float): The font size, used to estimate the size.
+        arg_separator (str): The separator used to join the fragments.
+        kind (str | None): The kind of the mobject being built.
+
+    Returns:
+        DraftPlaceholder: A box of the estimated size.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    pending = _PENDING.get(key)
+    if pending is None or (pending.done() and pending.exception() is not None):
+        pending = _PENDING[key] = _EXECUTOR.submit(build)
+    return DraftPlaceholder(
+        pending,
+        *estimate_tex_size(tex_strings, font_size),
+        source=arg_separator.join(t for t in tex_strings if isinstance(t, str)),
+        kind=kind,
+    )
+
+
+def swap_placeholders(mobject: Mobject | Scene) -> int:
+    """
+    Swaps every finished placeholder in a mobject or scene for its real mobject.
+
+    Args:
+        mobject (Mobject | Scene): Where to look for placeholders.
+
+    Returns:
+        int: The number of placeholders still waiting for their build.
+    """
+    members = (
+        mobject.get_mobject_family_members()
+        if isinstance(mobject, Scene)
+        else mobject.get_family()
+    )
+    placeholders = [m for m in members if isinstance(m, DraftPlaceholder)]
+    for placeholder in placeholders:
+        placeholder.swap_if_ready()
+    return sum(placeholder.pending is not None for placeholder in placeholders)
+
+
+class DraftScene(FreezableScene):
+    """
+    Scene that can render in draft mode, per scene or following the session.
+
+    In draft mode animations are skipped and only the final frame is written, plus
+    a still after every play call listed in ``key_frames``. Placeholders whose
+    TeX finishes within ``draft_wait`` seconds are swapped in before each still.
+
+    Example:
+        class Chapter1(DraftScene, Themes):
+            draft = True
+            key_frames = [2, 5]
+    """
+
+    draft: bool | None = None
+    key_frames: Sequence[int] = ()
+    draft_wait: float = 0.5
+
+    def __init__(self, *args, **kwargs):
+        self._session_state = get_draft_state()
+        if self.draft is not None and self.draft != is_draft_mode():
+            set_draft_mode(self.draft)
+        super().__init__(*args, **kwargs)
+
+    def play(self, *args, **kwargs):
+        if is_draft_mode():
+            swap_placeholders(self)
+        super().play(*args, **kwargs)
+        if is_draft_mode() and self.renderer.num_plays in self.key_frames:
+            self.save_key_frame()
+
+    def save_key_frame(self, name: str | None = None) -> Path:
+        """
+        Saves the current frame as a still next to the scene's final image.
+
+        Args:
+            name (str | None): The file name suffix. Defaults to the play count.
+
+        Returns:
+            Path: The path of the saved image.
+        """
+        swap_placeholders(self)
+        self.renderer.update_frame(self, ignore_skipping=True)
+        image_path = self.renderer.file_writer.image_file_path
+        name = name or f"{self.renderer.num_plays:03}"
+        path = image_path.with_name(f"{image_path.stem}_{name}{image_path.suffix}")
+        self.renderer.get_image().save(path)
+        return path
+
+    def tear_down(self):
+        if is_draft_mode():
+            pending = [
+                mobject.pending
+                for mobject in self.get_mobject_family_members()
+                if isinstance(mobject, DraftPlaceholder) and mobject.pending is not None
+            ]
+            wait(pending, timeout=self.draft_wait)
+            swap_placeholders(self)
+        super().tear_down()
+
+    def render(self, preview: bool = False):
+        try:
+            return super().render(preview)
+        finally:
+            set_draft_state(self._session_state)
@@ -0,0 +1,162 @@
+import bisect
+import functools
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+from manim import logger
+
+"""
+This module provides a per-codepoint font coverage index, built once from
+fontconfig and cached on disk, for picking a font that covers a given string.
+"""
+
+DEVANAGARI_FONTS = [
+    "Lohit Devanagari",
+    "Arial Unicode MS",
+    "Noto Sans Devanagari",
+    "Mangal",
+    "Devanagari New",
+    "Nirmala UI",
+    "Hind",
+]
+
+_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "manim_devanagari"
+    / "font_coverage.json"
+)
+
+
+def _fc_list(format: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["fc-list", "--format", format],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_charset(charset: str) -> list[tuple[int, int]]:
+    ranges = []
+    for item in charset.split():
+        start, _, end = item.partition("-")
+        ranges.append((int(start, 16), int(end or start, 16)))
+    return ranges
+
+
+def _merge_ranges(ranges: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    starts, ends = [], []
+    for start, end in sorted(ranges):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _build_index() -> dict[str, tuple[list[int], list[int]]]:
+    output = _fc_list("%{family[0]}\t%{charset}\n") or ""
+    ranges = {}
+    for line in output.splitlines():
+        family, _, charset = line.partition("\t")
+        if family and charset:
+            ranges.setdefault(family, []).extend(_parse_charset(charset))
+    return {
+        family: _merge_ranges(family_ranges) for family, family_ranges in ranges.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def coverage_index() -> dict[str, tuple[list[int], list[int]]]:
+    """
+    Maps every installed font family to the Unicode ranges it covers.
+
+    The index is built from fontconfig once and cached on disk. It is rebuilt
+    only when the list of installed font files changes.
+
+    Returns:
+        dict[str, tuple[list[int], list[int]]]: Sorted range starts and ends per
+        family, or an empty dict if fontconfig is not available.
+    """
+    files = _fc_list("%{file}\n")
+    if files is None:
+        return {}
+    signature = hashlib.sha1("\n".join(sorted(files.splitlines())).encode()).hexdigest()
+    try:
+        cached = json.loads(_CACHE_PATH.read_text())
+        if cached["signature"] == signature:
+            return {family: tuple(ranges) for family, ranges in cached["index"].items()}
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = _build_index()
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps({"signature": signature, "index": index}))
+        temp_path.replace(_CACHE_PATH)
+    except OSError as error:
+        logger.debug(f"Could not cache the font coverage index: {error}")
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _families_by_name() -> dict[str, str]:
+    return {family.lower(): family for family in coverage_index()}
+
+
+def font_covers(font: str, text: str) -> bool | None:
+    """
+    Checks whether a font has glyphs for every non-space character of a string.
+
+    Args:
+        font (str): The font family name.
+        text (str): The text to check.
+
+    Returns:
+        bool | None: Whether the font covers the text, or None if the font is not
+        in the coverage index.
+    """
+    family = _families_by_name().get(font.lower())
+    if family is None:
+        return None
+    starts, ends = coverage_index()[family]
+    for codepoint in {ord(char) for char in text if not char.isspace()}:
+        position = bisect.bisect_right(starts, codepoint) - 1
+        if position < 0 or ends[position] < codepoint:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def font_for_text(text: str, font: str) -> str:
+    """
+    Picks a font that covers the text, preferring the given font.
+
+    The given font is kept if it covers the text or if coverage is unknown.
+    Otherwise the Devanagari fallbacks are tried in order, then every other
+    installed family.
+
+    Args:
+        text (str): The text that will be rendered.
+        font (str): The preferred font family.
+
+    Returns:
+        str: The font family to render the text with.
+
+    Example:
+        font_for_text("नमस्ते", "Noto Sans")  # e.g. "Lohit Devanagari"
+    """
+    if font_covers(font, text) is not False:
+        return font
+    for fallback in [*DEVANAGARI_FONTS, *sorted(coverage_index())]:
+        if font_covers(fallback, text):
+            return _families_by_name()[fallback.lower()]
+    logger.warning(f"No installed font covers every character of {text!r}.")
+    return font
@@ -0,0 +1,196 @@
+import hashlib
+from manim import *
+from typing_extensions import Self
+from manim_devanagari.memory import restore_from_source, restore_in_frame
+
+"""
+This module provides a frozen raster mode: a static mobject is rasterized once at
+output resolution and shown as an image until an animation touches it again.
+"""
+
+
+class Freezable:
+    """
+    Mixin that lets a mobject be swapped for a cached raster image of itself.
+
+    A frozen mobject costs one image blit per frame instead of rasterizing every
+    glyph path. The image is cached and only redrawn when the mobject's points,
+    style or the camera change.
+
+    Example:
+        notebook = Notebook("पहला वाक्य", "Second line")
+        self.add(notebook)
+        notebook.freeze(self)
+        self.play(pointer.animate.shift(DOWN))  # notebook is drawn as an image
+        notebook.unfreeze(self)
+    """
+
+    frozen_image: ImageMobject | None = None
+    is_frozen: bool = False
+    _frozen_key: str | None = None
+
+    def _get_freeze_key(self, camera: Camera) -> str:
+        state = hashlib.sha1()
+        for mobject in self.get_family():
+            state.update(np.ascontiguousarray(mobject.points).tobytes())
+            for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+                state.update(np.ascontiguousarray(getattr(mobject, attr, ())).tobytes())
+            state.update(repr(getattr(mobject, "stroke_width", None)).encode())
+        state.update(
+            repr(
+                (
+                    camera.pixel_width,
+                    camera.pixel_height,
+                    camera.frame_width,
+                    camera.frame_height,
+                    tuple(camera.frame_center),
+                )
+            ).encode()
+        )
+        return state.hexdigest()
+
+    def get_frozen_image(self, camera: Camera | None = None) -> ImageMobject:
+        """
+        Rasterizes the mobject at the camera's output resolution.
+
+        Args:
+            camera (Camera | None): The camera whose resolution and frame are used.
+                Defaults to a camera built from the current config.
+
+        Returns:
+            ImageMobject: An image covering the mobject, at the same position and
+            z-index. The result is cached until the mobject or camera changes.
+        """
+        camera = camera if camera is not None else Camera()
+        key = self._get_freeze_key(camera)
+        if self.frozen_image is not None and self._frozen_key == key:
+            return self.frozen_image
+
+        raster = Camera(
+            pixel_width=camera.pixel_width,
+            pixel_height=camera.pixel_height,
+            frame_width=camera.frame_width,
+            frame_height=camera.frame_height,
+            frame_center=np.array(camera.frame_center),
+            background_opacity=0,
+        )
+        raster.capture_mobject(self)
+
+        # Crop to the mobject's bounding box, with a small margin for strokes.
+        pixels_per_unit = raster.pixel_width / raster.frame_width
+        frame_ul = np.array(raster.frame_center) + np.array(
+            [-raster.frame_width / 2, raster.frame_height / 2, 0]
+        )
+        left, top = (self.get_corner(UL) - frame_ul)[:2] * [1, -1] * pixels_per_unit
+        right, bottom = (self.get_corner(DR) - frame_ul)[:2] * [1, -1] * pixels_per_unit
+        left = int(np.clip(np.floor(left) - 2, 0, raster.pixel_width - 1))
+        top = int(np.clip(np.floor(top) - 2, 0, raster.pixel_height - 1))
+        right = int(np.clip(np.ceil(right) + 2, left + 1, raster.pixel_width))
+        bottom = int(np.clip(np.ceil(bottom) + 2, top + 1, raster.pixel_height))
+
+        image = ImageMobject(
+            raster.pixel_array[top:bottom, left:right],
+            scale_to_resolution=raster.pixel_height,
+        )
+        image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        # scale_to_resolution sizes the image from the global frame height, not
+        # this camera's frame, so size it to the crop explicitly.
+        image.scale_to_fit_height((bottom - top) / pixels_per_unit)
+        image.move_to(
+            frame_ul
+            + np.array([(left + right) / 2, -(top + bottom) / 2, 0]) / pixels_per_unit
+        )
+        image.set_z_index(self.z_index)
+        self.frozen_image = image
+        self._frozen_key = key
+        return image
+
+    def freeze(self, scene: Scene) -> Self:
+        """
+        Replaces the mobject in the scene with its cached raster image.
+
+        Args:
+            scene (Scene): The scene showing the mobject.
+
+        Returns:
+            Self: The (now hidden) vector mobject.
+        """
+        if self.is_frozen:
+            return self
+        image = self.get_frozen_image(scene.camera)
+        if self in scene.get_mobject_family_members():
+            scene.replace(self, image)
+        else:
+            scene.add(image)
+        self.is_frozen = True
+        if isinstance(scene, FreezableScene):
+            scene.frozen_mobjects.append(self)
+        return self
+
+    def unfreeze(self, scene: Scene) -> Self:
+        """
+        Swaps the raster image in the scene back for the vector mobject.
+
+        Args:
+            scene (Scene): The scene showing the frozen image.
+
+        Returns:
+            Self: The vector mobject.
+        """
+        if not self.is_frozen:
+            return self
+        if self.frozen_image in scene.get_mobject_family_members():
+            scene.replace(self.frozen_image, self)
+        self.is_frozen = False
+        if isinstance(scene, FreezableScene) and self in scene.frozen_mobjects:
+            scene.frozen_mobjects.remove(self)
+        return self
+
+
+class FreezableScene(Scene):
+    """
+    Scene that swaps frozen mobjects back to vectors, and rebuilds dropped
+    entries from their source, when an animation touches them or when they are
+    in the camera frame before or after a play call. Before that, it applies the
+    memory budget of every Notebook in the scene.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.frozen_mobjects = []
+        super().__init__(*args, **kwargs)
+
+    def play(self, *args, **kwargs):
+        for mobject in self.get_mobject_family_members():
+            if getattr(mobject, "memory_budget", None) is not None:
+                mobject.enforce_memory_budget(self.camera)
+        animated = {}
+        for animation in args:
+            animations = (
+                animation if isinstance(animation, (list, tuple)) else [animation]
+            )
+            for item in animations:
+                mobject = getattr(item, "mobject", None)
+                if mobject is not None:
+                    animated.update((id(m), m) for m in mobject.get_family())
+        for frozen in list(self.frozen_mobjects):
+            # A frozen entry inside a group is replaced there by its image, so
+            # animating the group animates the image, not the entry.
+            if id(frozen.frozen_image) in animated or animated.keys() & set(
+                map(id, frozen.get_family())
+            ):
+                frozen.unfreeze(self)
+        # .animate builds the target before play is called, so dropped copies
+        # in the target are rebuilt too, or the entry would animate back into
+        # its placeholder.
+        targets = [
+            member
+            for mobject in animated.values()
+            if getattr(mobject, "target", None) is not None
+            for member in mobject.target.get_family()
+        ]
+        for mobject in [*animated.values(), *targets]:
+            if getattr(mobject, "dropped_source", None) is not None:
+                restore_from_source(mobject)
+        restore_in_frame(self)
+        super().play(*args, **kwargs)
+        restore_in_frame(self)
@@ -3,7 +3,9 @@ from manim import *
 import manimpango
 import functools
 from typing import Sequence
+from manim_devanagari.fonts import DEVANAGARI_FONTS, font_for_text
 from manim_devanagari import (
+    cached_mobject,
     Text,
     Paragraph,
     MarkupText,
@@ -46,20 +48,13 @@ def check_font(self, font: str, tuple_value=False) -> bool:
     return (font, False) if tuple_value else False
 
 
-def check_default_font(self, font: str) -> str:
-    fonts = [
-        font,
-        "Lohit Devanagari",
-        "Arial Unicode MS",
-        "Noto Sans Devanagari",
-        "Mangal",
-        "Devanagari New",
-        "Nirmala UI",
-        "Hind",
-    ]
+def check_default_font(self, font: str, text: str = "") -> str:
+    if text:
+        return font_for_text(text, font)
+    fonts = [font, *DEVANAGARI_FONTS]
     for f in fonts:
-        f, check_font = check_font(f, tuple_value=True)
-        if check_font:
+        f, is_installed = check_font(self, f, tuple_value=True)
+        if is_installed:
             return f
 
     logger.error(f"Font {font} is not font")
@@ -183,30 +178,30 @@ def _str_to_mobject_convert(text: str) -> VMobject:
         is_markuptext = is_html(text)
         if is_hindi_str:
             if is_math_mode_display_str:
-                return Deva_MathTex_Display(text[2:-2].strip())
+                return cached_mobject(Deva_MathTex_Display, text[2:-2].strip())
             elif is_latex_str or is_str_inline_math:
                 if is_math_mode_inline(text):
-                    return Deva_Tex(text[1:-1].strip())
-                return Deva_Tex(text)
+                    return cached_mobject(Deva_Tex, text[1:-1].strip())
+                return cached_mobject(Deva_Tex, text)
             elif is_markuptext:
-                return Deva_MarkupText(text)
+                return cached_mobject(Deva_MarkupText, text)
             else:
                 if len(text) <= text_line:
-                    return Deva_Text(text)
-                return Deva_Paragraph(text)
+                    return cached_mobject(Deva_Text, text)
+                return cached_mobject(Deva_Paragraph, text)
         else:
             if is_math_mode_display_str:
-                return MathTex_Display(text[2:-2].strip())
+                return cached_mobject(MathTex_Display, text[2:-2].strip())
             elif is_latex_str or is_str_inline_math:
                 if is_math_mode_inline(text):
-                    return Deva_Tex(text[1:-1].strip())
-                return Tex(text)
+                    return cached_mobject(Deva_Tex, text[1:-1].strip())
+                return cached_mobject(Tex, text)
             elif is_markuptext:
-                return MarkupText(text)
+                return cached_mobject(MarkupText, text)
             else:
                 if len(text) <= text_line:
-                    return Text(text)
-                return Paragraph(text)
+                    return cached_mobject(Text, text)
+                return cached_mobject(Paragraph, text)
 
     elif isinstance(text, tuple):
         str_lst = " ".join(text)
@@ -217,30 +212,30 @@ def _str_to_mobject_convert(text: str) -> VMobject:
         is_markuptext = is_html(str_lst)
         if is_hindi_str:
             if is_math_mode_display_str:
-                return Deva_MathTex_Display(*text[1:-1])
+                return cached_mobject(Deva_MathTex_Display, *text[1:-1])
             elif is_latex_str or is_str_inline_math:
                 if is_math_mode_inline(str_lst):
-                    return Deva_Tex(text[1:-1])
-                return Deva_Tex(*text)
+                    return cached_mobject(Deva_Tex, text[1:-1])
+                return cached_mobject(Deva_Tex, *text)
             elif is_markuptext:
-                return Deva_MarkupText(str_lst)
+                return cached_mobject(Deva_MarkupText, str_lst)
             else:
                 if len(text) > text_line:
-                    return Deva_Text(str_lst)
-                return Deva_Paragraph(*text)
+                    return cached_mobject(Deva_Text, str_lst)
+                return cached_mobject(Deva_Paragraph, *text)
         else:
             if is_math_mode_display_str:
-                return MathTex_Display(*text[1:-1])
+                return cached_mobject(MathTex_Display, *text[1:-1])
             elif is_latex_str or is_str_inline_math:
                 if is_math_mode_inline(str_lst):
-                    return Deva_Tex(text[1:-1])
-                return Tex(*text)
+                    return cached_mobject(Deva_Tex, text[1:-1])
+                return cached_mobject(Tex, *text)
             elif is_markuptext:
-                return MarkupText(str_lst)
+                return cached_mobject(MarkupText, str_lst)
             else:
                 if len(text) > text_line:
-                    return Text(str_lst)
-                return Paragraph(*text)
+                    return cached_mobject(Text, str_lst)
+                return cached_mobject(Paragraph, *text)
     return text
 
 
@@ -249,6 +244,10 @@ def _str_to_mobject(*vmobjects: VMobject) -> Sequence[VMobject]:
 
 
 def mobject_to_text(mobject: Mobject) -> str():
+    # Plugin mobjects carry the string they were built from
+    source = getattr(mobject, "source", None)
+    if source is not None:
+        return source
     # Tex() or MathTex()
     match type(mobject).__name__:
         case "VGroup":
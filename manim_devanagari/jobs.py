@@ -0,0 +1,466 @@
+import argparse
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+"""
+This module provides a durable render job queue backed by a SQLite database, and
+worker processes that pull scenes and Notebook source files from it.
+
+The database can live on a shared filesystem, so several machines can render from
+one queue without a central service. Jobs are claimed with a lease that workers
+extend with heartbeats; a job whose lease runs out is handed to another worker.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    source_path TEXT NOT NULL,
+    scene_name TEXT,
+    options TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires);
+"""
+
+
+class JobQueue:
+    """
+    A render job queue stored in a SQLite database.
+
+    Args:
+        path (str | Path): The database file. It is created if it does not exist.
+        timeout (float): Seconds to wait for another process's lock. Defaults to 30.
+
+    Example:
+        queue = JobQueue("renders.db")
+        queue.enqueue_scene("lesson_1.py", "Chapter1")
+        queue.enqueue_notebook("lesson_1_notes.txt")
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30):
+        self.path = str(path)
+        self.timeout = timeout
+        connection = self._connect()
+        try:
+            connection.executescript(_SCHEMA)
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _transaction(self, query, *params) -> list[sqlite3.Row]:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            rows = query(connection, *params)
+            connection.execute("COMMIT")
+            return rows
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def enqueue(
+        self,
+        kind: str,
+        source_path: str | Path,
+        scene_name: str | None = None,
+        options: dict | None = None,
+        max_attempts: int = 3,
+    ) -> int:
+        """
+        Adds a job, unless a job with the same content hash is already queued.
+
+        A failed job with the same content hash is requeued with its attempts
+        reset.
+
+        The content hash covers the job kind, the source file's contents, the
+        scene name and the render options.
+
+        Args:
+            kind (str): "scene" or "notebook".
+            source_path (str | Path): The Python scene file or Notebook source file.
+            scene_name (str | None): The Scene class to render, for scene jobs.
+            options (dict | None): Manim config options for the render.
+            max_attempts (int): How often the job is tried before it fails. Defaults to 3.
+
+        Returns:
+            int: The id of the new or existing job.
+        """
+        if kind not in ("scene", "notebook"):
+            raise ValueError(f"Unknown job kind {kind!r}")
+        source_path = Path(source_path).resolve()
+        options = json.dumps(options or {}, sort_keys=True)
+        content_hash = hashlib.sha256(
+            b"\0".join(
+                [
+                    kind.encode(),
+                    source_path.read_bytes(),
+                    (scene_name or "").encode(),
+                    options.encode(),
+                ]
+            )
+        ).hexdigest()
+
+        def insert(connection):
+            now = time.time()
+            connection.execute(
+                "INSERT INTO jobs (content_hash, kind, source_path,"
+                " scene_name, options, max_attempts, created, updated)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (content_hash) DO UPDATE SET status = 'pending',"
+                " attempts = 0, error = NULL, max_attempts = excluded.max_attempts,"
+                " updated = excluded.updated WHERE status = 'failed'",
+                (
+                    content_hash,
+                    kind,
+                    str(source_path),
+                    scene_name,
+                    options,
+                    max_attempts,
+                    now,
+                    now,
+                ),
+            )
+            return connection.execute(
+                "SELECT id FROM jobs WHERE content_hash = ?", (content_hash,)
+            ).fetchall()
+
+        return self._transaction(insert)[0]["id"]
+
+    def enqueue_scene(self, source_path: str | Path, scene_name: str, **kwargs) -> int:
+        """Adds a job rendering ``scene_name`` from a Python file. See :meth:`enqueue`."""
+        return self.enqueue("scene", source_path, scene_name, **kwargs)
+
+    def enqueue_notebook(self, source_path: str | Path, **kwargs) -> int:
+        """Adds a job rendering a Notebook source file. See :meth:`enqueue`."""
+        return self.enqueue("notebook", source_path, **kwargs)
+
+    def claim(self, worker: str, lease: float = 60) -> sqlite3.Row | None:
+        """
+        Claims the oldest pending job, or a running job whose lease has expired.
+
+        Args:
+            worker (str): The id of the claiming worker.
+            lease (float): Seconds until the claim expires without a heartbeat.
+
+        Returns:
+            sqlite3.Row | None: The claimed job, or None if there is nothing to do.
+        """
+
+        def claim_job(connection):
+            now = time.time()
+            connection.execute(
+                "UPDATE jobs SET status = 'failed', error = 'lease expired',"
+                " updated = ? WHERE status = 'running' AND lease_expires < ?"
+                " AND attempts >= max_attempts",
+                (now, now),
+            )
+            job = connection.execute(
+                "SELECT id FROM jobs WHERE status = 'pending'"
+                " OR (status = 'running' AND lease_expires < ?)"
+                " ORDER BY id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if job is None:
+                return []
+            connection.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, lease_expires = ?,"
+                " attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker, now + lease, now, job["id"]),
+            )
+            return connection.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job["id"],)
+            ).fetchall()
+
+        jobs = self._transaction(claim_job)
+        return jobs[0] if jobs else None
+
+    def heartbeat(self, job_id: int, worker: str, lease: float = 60) -> bool:
+        """
+        Extends the lease of a claimed job.
+
+        Returns:
+            bool: False if the job is no longer held by this worker.
+        """
+
+        def extend(connection):
+            now = time.time()
+            return connection.execute(
+                "UPDATE jobs SET lease_expires = ?, updated = ?"
+                " WHERE id = ? AND worker = ? AND status = 'running'",
+                (now + lease, now, job_id, worker),
+            ).rowcount
+
+        return bool(self._transaction(extend))
+
+    def complete(self, job_id: int, worker: str, result: dict) -> bool:
+        """
+        Records the result of a job and marks it as done.
+
+        Returns:
+            bool: False if the job is no longer held by this worker.
+        """
+
+        def finish(connection):
+            return connection.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL,"
+                " lease_expires = NULL, updated = ?"
+                " WHERE id = ? AND worker = ? AND status = 'running'",
+                (json.dumps(result), time.time(), job_id, worker),
+            ).rowcount
+
+        return bool(self._transaction(finish))
+
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        """
+        Records an error. The job is retried until it runs out of attempts.
+
+        Returns:
+            bool: False if the job is no longer held by this worker.
+        """
+
+        def retry(connection):
+            return connection.execute(
+                "UPDATE jobs SET error = ?, lease_expires = NULL, updated = ?,"
+                " status = CASE WHEN attempts < max_attempts"
+                " THEN 'pending' ELSE 'failed' END"
+                " WHERE id = ? AND worker = ? AND status = 'running'",
+                (error, time.time(), job_id, worker),
+            ).rowcount
+
+        return bool(self._transaction(retry))
+
+    def counts(self) -> dict[str, int]:
+        """
+        Returns the number of jobs in each status.
+
+        Returns:
+            dict[str, int]: Job counts keyed by status.
+        """
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+            ).fetchall()
+        finally:
+            connection.close()
+        return {row["status"]: row["count"] for row in rows}
+
+
+_MODULES = {}
+
+
+def _load_scene(source_path: str, scene_name: str):
+    # Modules stay loaded between jobs, so the plugin's caches stay warm.
+    key = (source_path, os.stat(source_path).st_mtime_ns)
+    if key not in _MODULES:
+        spec = importlib.util.spec_from_file_location(
+            f"_manim_devanagari_job_{len(_MODULES)}", source_path
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _MODULES[key] = module
+    return getattr(_MODULES[key], scene_name)
+
+
+def _notebook_scene(source_path: str):
+    from manim_devanagari import Themes
+    from manim_devanagari.notebook import Notebook
+
+    # Entries are separated by blank lines.
+    text = Path(source_path).read_text(encoding="utf-8")
+    entries = [entry.strip() for entry in text.split("\n\n") if entry.strip()]
+
+    class NotebookScene(Themes):
+        def construct(self):
+            self.add(Notebook(*entries))
+
+    NotebookScene.__name__ = Path(source_path).stem
+    return NotebookScene
+
+
+def render_job(job: sqlite3.Row) -> dict:
+    """
+    Renders a claimed job in this process.
+
+    Args:
+        job (sqlite3.Row): The job, as returned by :meth:`JobQueue.claim`.
+
+    Returns:
+        dict: The output file of the render.
+    """
+    from manim import tempconfig
+
+    options = json.loads(job["options"])
+    if job["kind"] == "scene":
+        scene_class = _load_scene(job["source_path"], job["scene_name"])
+    else:
+        scene_class = _notebook_scene(job["source_path"])
+        options.setdefault("save_last_frame", True)
+    with tempconfig(options):
+        scene = scene_class()
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        output = (
+            file_writer.image_file_path
+            if options.get("save_last_frame")
+            else file_writer.movie_file_path
+        )
+    return {"output": str(output)}
+
+
+def run_worker(
+    queue_path: str | Path,
+    worker: str | None = None,
+    lease: float = 60,
+    poll_interval: float = 2,
+    max_jobs: int | None = None,
+) -> int:
+    """
+    Claims and renders jobs until the queue is empty or ``max_jobs`` are done.
+
+    Args:
+        queue_path (str | Path): The queue database.
+        worker (str | None): The worker id. Defaults to host name and process id.
+        lease (float): Seconds a claim is held without a heartbeat. Defaults to 60.
+        poll_interval (float): Seconds to wait before exiting on an empty queue.
+        max_jobs (int | None): Stop after this many jobs. Defaults to None.
+
+    Returns:
+        int: The number of jobs this worker finished.
+    """
+    queue = JobQueue(queue_path)
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    finished = 0
+    while max_jobs is None or finished < max_jobs:
+        job = queue.claim(worker, lease)
+        if job is None:
+            time.sleep(poll_interval)
+            job = queue.claim(worker, lease)
+            if job is None:
+                break
+
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(lease / 3):
+                if not queue.heartbeat(job["id"], worker, lease):
+                    break
+
+        heart = threading.Thread(target=beat, daemon=True)
+        heart.start()
+        try:
+            result = render_job(job)
+        except Exception as error:
+            queue.fail(job["id"], worker, f"{type(error).__name__}: {error}")
+        else:
+            queue.complete(job["id"], worker, result)
+        finally:
+            stop.set()
+            heart.join()
+        finished += 1
+    return finished
+
+
+def run_workers(queue_path: str | Path, processes: int = 1, **kwargs) -> None:
+    """
+    Runs several worker processes on one queue and waits for them to finish.
+
+    Args:
+        queue_path (str | Path): The queue database.
+        processes (int): The number of worker processes. Defaults to 1.
+        **kwargs: Keyword arguments for :func:`run_worker`.
+    """
+    if processes == 1:
+        run_worker(queue_path, **kwargs)
+        return
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(queue_path,), kwargs=kwargs)
+        for _ in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_devanagari.jobs",
+        description="Queue and render manim_devanagari lessons.",
+    )
+    parser.add_argument("queue", help="path of the queue database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scene = commands.add_parser("scene", help="enqueue a scene from a Python file")
+    scene.add_argument("source")
+    scene.add_argument("scene_name")
+    notebook = commands.add_parser("notebook", help="enqueue a Notebook source file")
+    notebook.add_argument("source")
+    for command in (scene, notebook):
+        command.add_argument(
+            "--option",
+            action="append",
+            default=[],
+            metavar="KEY=VALUE",
+            help="manim config option, e.g. quality=low_quality",
+        )
+
+    worker = commands.add_parser("worker", help="render queued jobs")
+    worker.add_argument("--processes", type=int, default=1)
+    worker.add_argument("--lease", type=float, default=60)
+    worker.add_argument("--max-jobs", type=int, default=None)
+    commands.add_parser("status", help="show job counts")
+
+    args = parser.parse_args(argv)
+    match args.command:
+        case "scene" | "notebook":
+            options = {}
+            for option in args.option:
+                key, _, value = option.partition("=")
+                try:
+                    options[key] = json.loads(value)
+                except ValueError:
+                    options[key] = value
+            job_id = JobQueue(args.queue).enqueue(
+                args.command, args.source, getattr(args, "scene_name", None), options
+            )
+            print(job_id)
+        case "worker":
+            run_workers(
+                args.queue,
+                processes=args.processes,
+                lease=args.lease,
+                max_jobs=args.max_jobs,
+            )
+        case "status":
+            print(json.dumps(JobQueue(args.queue).counts()))
+
+
+if __name__ == "__main__":
+    main()
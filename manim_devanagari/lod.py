@@ -0,0 +1,127 @@
+import hashlib
+from manim import *
+
+"""
+This module provides level-of-detail curve simplification, which drops Bézier
+detail that is below pixel size on screen.
+"""
+
+_SIMPLIFY_CACHE: dict[tuple[str, float], np.ndarray] = {}
+_SIMPLIFY_CACHE_SIZE = 4096
+_MERGE_PASSES = 4
+_ALPHAS = np.linspace(0, 1, 4)[None, :, None]
+
+
+def _distance_to_segment(points: np.ndarray, start: np.ndarray, end: np.ndarray):
+    segment = end - start
+    length = np.sum(segment**2, axis=-1, keepdims=True)
+    offset = points - start
+    along = np.sum(offset * segment, axis=-1, keepdims=True) / np.where(
+        length > 0, length, 1
+    )
+    return np.linalg.norm(offset - np.clip(along, 0, 1) * segment, axis=-1)
+
+
+def simplify_points(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Reduces the number of cubic Bézier curves, keeping the outline within tolerance.
+
+    Neighbouring curves whose control points all lie close to the segment joining
+    their outer anchors are merged into a single line. This removes both detail
+    smaller than the tolerance and runs of collinear curves. Each pass is
+    vectorized over all curves, and results are cached per input and tolerance.
+
+    Args:
+        points (np.ndarray): Cubic Bézier control points, four per curve.
+        tolerance (float): Maximum allowed deviation, in scene units.
+
+    Returns:
+        np.ndarray: The simplified control points.
+    """
+    if len(points) < 8 or tolerance <= 0:
+        return points
+    key = (hashlib.sha1(np.ascontiguousarray(points).tobytes()).hexdigest(), tolerance)
+    if key in _SIMPLIFY_CACHE:
+        return _SIMPLIFY_CACHE[key].copy()
+
+    curves = points.reshape(-1, 4, 3).copy()
+    new_path = np.ones(len(curves), dtype=bool)
+    new_path[1:] = np.any(np.abs(curves[1:, 0] - curves[:-1, 3]) > 1e-8, axis=1)
+
+    # Every pass may move the outline by at most step_tolerance, and the pair
+    # parity alternates between passes so that merged pairs never overlap.
+    step_tolerance = tolerance / _MERGE_PASSES
+    for merge_pass in range(_MERGE_PASSES):
+        pair_points = np.concatenate([curves[:-1], curves[1:, 1:]], axis=1)
+        pairs = ~new_path[1:] & (np.arange(len(curves) - 1) % 2 == merge_pass % 2)
+        pairs &= (
+            _distance_to_segment(pair_points, curves[:-1, :1], curves[1:, 3:]).max(
+                axis=1
+            )
+            < step_tolerance
+        )
+        if not pairs.any():
+            continue
+        first = np.flatnonzero(pairs)
+        start, end = curves[first, 0], curves[first + 1, 3]
+        curves[first] = start[:, None] + _ALPHAS * (end - start)[:, None]
+        keep = np.ones(len(curves), dtype=bool)
+        keep[first + 1] = False
+        curves = curves[keep]
+        new_path = new_path[keep]
+
+    simplified = curves.reshape(-1, 3)
+    if len(_SIMPLIFY_CACHE) >= _SIMPLIFY_CACHE_SIZE:
+        _SIMPLIFY_CACHE.clear()
+    _SIMPLIFY_CACHE[key] = simplified
+    return simplified.copy()
+
+
+def get_pixel_tolerance(
+    tolerance_px: float = 0.5, camera: Camera | None = None
+) -> float:
+    """
+    Converts a tolerance in output pixels into scene units.
+
+    Args:
+        tolerance_px (float): The tolerance in pixels. Defaults to 0.5.
+        camera (Camera | None): The camera that renders the mobject. Defaults to
+            the current config.
+
+    Returns:
+        float: The tolerance in scene units.
+    """
+    if camera is None:
+        return tolerance_px * config.frame_width / config.pixel_width
+    return tolerance_px * camera.frame_width / camera.pixel_width
+
+
+def simplify_curves(
+    mobject: Mobject, tolerance_px: float = 0.5, camera: Camera | None = None
+) -> Mobject:
+    """
+    Simplifies the curves of a mobject and its family for its current on-screen size.
+
+    The tolerance is measured at the mobject's current size, so apply this after
+    the mobject has been scaled to its final size.
+
+    Args:
+        mobject (Mobject): The mobject to simplify in place.
+        tolerance_px (float): Maximum deviation of the outline, in output pixels.
+            Defaults to 0.5.
+        camera (Camera | None): The camera that renders the mobject. Defaults to
+            the current config.
+
+    Returns:
+        Mobject: The simplified mobject.
+
+    Example:
+        caption = Deva_Text("पाद टिप्पणी", font_size=14)
+        simplify_curves(caption, tolerance_px=0.5)
+    """
+    tolerance = get_pixel_tolerance(tolerance_px, camera)
+    for submobject in mobject.family_members_with_points():
+        if getattr(submobject, "n_points_per_cubic_curve", None) != 4:
+            continue
+        submobject.points = simplify_points(submobject.points, tolerance)
+    return mobject
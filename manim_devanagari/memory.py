@@ -0,0 +1,194 @@
+from manim import *
+
+"""
+This module provides memory accounting for mobjects, and lets entries that are not
+visible be dropped down to their source string and rebuilt when shown again.
+"""
+
+
+def get_point_bytes(mobject: Mobject) -> int:
+    """
+    Returns the number of bytes held by the point arrays of a mobject and its family.
+
+    Args:
+        mobject (Mobject): The mobject to measure.
+
+    Returns:
+        int: The total size of all point arrays, in bytes.
+    """
+    return sum(member.points.nbytes for member in mobject.get_family())
+
+
+def memory_report(mobject: Mobject) -> list[tuple[int, str, int]]:
+    """
+    Reports the point-array bytes held by each submobject of a mobject.
+
+    Args:
+        mobject (Mobject): The mobject whose submobjects are measured.
+
+    Returns:
+        list[tuple[int, str, int]]: ``(index, class name, bytes)`` per submobject.
+
+    Example:
+        for index, name, size in memory_report(notebook):
+            print(index, name, size)
+    """
+    return [
+        (index, type(submobject).__name__, get_point_bytes(submobject))
+        for index, submobject in enumerate(mobject.submobjects)
+    ]
+
+
+def is_visible(mobject: Mobject, camera: Camera | None = None) -> bool:
+    """
+    Checks whether any part of a mobject is drawn inside the camera frame.
+
+    Args:
+        mobject (Mobject): The mobject to check.
+        camera (Camera | None): The camera. Defaults to the current config.
+
+    Returns:
+        bool: False if the mobject is fully transparent or outside the frame.
+    """
+    return not is_faded(mobject) and is_in_frame(mobject, camera)
+
+
+def is_faded(mobject: Mobject) -> bool:
+    """
+    Checks whether every part of a mobject is fully transparent.
+
+    Args:
+        mobject (Mobject): The mobject to check.
+
+    Returns:
+        bool: True if no fill or stroke of the mobject is drawn.
+    """
+    return not any(
+        np.any(member.get_fill_opacities() > 0)
+        or np.any(member.get_stroke_opacities() > 0)
+        for member in mobject.family_members_with_points()
+        if isinstance(member, VMobject)
+    )
+
+
+def is_in_frame(mobject: Mobject, camera: Camera | None = None) -> bool:
+    """
+    Checks whether the bounding box of a mobject overlaps the camera frame.
+
+    Args:
+        mobject (Mobject): The mobject to check.
+        camera (Camera | None): The camera. Defaults to the current config.
+
+    Returns:
+        bool: True if the mobject is at least partly inside the frame.
+    """
+    if camera is None:
+        frame_center = ORIGIN
+        frame_width, frame_height = config.frame_width, config.frame_height
+    else:
+        frame_center = np.array(camera.frame_center)
+        frame_width, frame_height = camera.frame_width, camera.frame_height
+    lower_left = mobject.get_corner(DL) - frame_center
+    upper_right = mobject.get_corner(UR) - frame_center
+    return bool(
+        lower_left[0] < frame_width / 2
+        and upper_right[0] > -frame_width / 2
+        and lower_left[1] < frame_height / 2
+        and upper_right[1] > -frame_height / 2
+    )
+
+
+def drop_to_source(mobject: VMobject, source: str | tuple) -> VMobject:
+    """
+    Frees the point data of a mobject, keeping its source and bounding box.
+
+    The mobject keeps its identity, so groups and animations holding it stay
+    valid. It is left as an invisible rectangle until it is restored. Its entry
+    in the mobject cache is evicted too, so the point data is really freed.
+
+    Args:
+        mobject (VMobject): The mobject to drop, in place.
+        source (str | tuple): The source string it was built from.
+
+    Returns:
+        VMobject: The dropped mobject.
+    """
+    from manim_devanagari import uncache_mobject
+
+    if getattr(mobject, "dropped_source", None) is not None:
+        return mobject
+    uncache_mobject(getattr(mobject, "cache_id", None))
+    mobject.dropped_faded = is_faded(mobject)
+    mobject.dropped_style = _get_family_styles(mobject)
+    corners = [mobject.get_corner(corner) for corner in (UL, UR, DR, DL, UL)]
+    mobject.submobjects = []
+    mobject.set_points_as_corners(corners)
+    mobject.set_fill(opacity=0).set_stroke(opacity=0)
+    mobject.dropped_source = source
+    return mobject
+
+
+def restore_from_source(mobject: VMobject) -> VMobject:
+    """
+    Rebuilds a dropped mobject from its source string, in place.
+
+    Args:
+        mobject (VMobject): A mobject dropped by :func:`drop_to_source`.
+
+    Returns:
+        VMobject: The restored mobject, at its previous position and size.
+    """
+    from manim_devanagari.helper import _str_to_mobject_convert
+
+    source = getattr(mobject, "dropped_source", None)
+    if source is None:
+        return mobject
+    rebuilt = _str_to_mobject_convert(source)
+    mobject.become(rebuilt, stretch=True, match_center=True)
+    # become takes the style of the rebuilt mobject, so put back the colours and
+    # opacities the entry had when it was dropped.
+    styles = getattr(mobject, "dropped_style", None) or []
+    members = [
+        member for member in mobject.get_family() if isinstance(member, VMobject)
+    ]
+    if len(styles) == len(members):
+        for member, style in zip(members, styles):
+            member.set_style(**style, family=False)
+    elif getattr(mobject, "dropped_faded", False):
+        mobject.set_opacity(0)
+    mobject.cache_id = getattr(rebuilt, "cache_id", None)
+    mobject.dropped_source = None
+    mobject.dropped_style = None
+    return mobject
+
+
+def _get_family_styles(mobject: Mobject) -> list[dict]:
+    return [
+        member.get_style()
+        for member in mobject.get_family()
+        if isinstance(member, VMobject)
+    ]
+
+
+def restore_in_frame(scene: Scene) -> list[Mobject]:
+    """
+    Rebuilds the dropped mobjects of a scene that the camera frame now overlaps.
+
+    Entries that were dropped while faded out are left alone.
+
+    Args:
+        scene (Scene): The scene to check.
+
+    Returns:
+        list[Mobject]: The restored mobjects.
+    """
+    restored = [
+        mobject
+        for mobject in scene.get_mobject_family_members()
+        if getattr(mobject, "dropped_source", None) is not None
+        and not getattr(mobject, "dropped_faded", False)
+        and is_in_frame(mobject, scene.camera)
+    ]
+    for mobject in restored:
+        restore_from_source(mobject)
+    return restored
@@ -1,31 +1,170 @@
+import bisect
 import textwrap
 from manim import *
 from typing import Iterable, Sequence
 from typing_extensions import Self, TypeAlias
 from manim.typing import Vector3D
 from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
+from manim_devanagari.freeze import Freezable
+from manim_devanagari.memory import (
+    drop_to_source,
+    get_point_bytes,
+    is_visible,
+    memory_report,
+    restore_from_source,
+)
 from manim_devanagari.helper import (
     _str_to_mobject,
+    mobject_to_text,
     SolutionText,
     AnswerText,
     QuestionText,
 )
 
-
 """
 This module provides custom Manim classes for creating structured text elements,
 footers, and organized groups of questions and answers for educational content.
 """
 
 
-class Notebook(VMobject):
-    def __init__(self, *vmobjects, **kwargs):
+class Notebook(Freezable, VMobject):
+    """
+    A column of entries built from strings or mobjects.
+
+    Attributes:
+        source (str): The source strings of all entries, one per line.
+        source_index (list[tuple[int, str, int, int]]): ``(index, kind, start, end)``
+            per entry, where ``source[start:end]`` is the entry's source.
+    """
+
+    kind = "notebook"
+
+    def __init__(self, *vmobjects, memory_budget: int | None = None, **kwargs):
         super().__init__(**kwargs)
+        self.memory_budget = memory_budget
+        self.entry_sources = [
+            vmobject if isinstance(vmobject, (str, tuple)) else None
+            for vmobject in vmobjects
+        ]
         vmobjects = _str_to_mobject(*vmobjects)
         self.add(*vmobjects)
+        self.build_source_index()
         self.arrange_notebook(DOWN, aligned_edge=LEFT)
         self.to_edge(UL)
 
+    def build_source_index(self) -> Self:
+        """
+        Maps every entry to its span in :attr:`source`.
+
+        Returns:
+            Self: The notebook.
+        """
+        sources, self.source_index = [], []
+        start = 0
+        for index, (entry, entry_source) in enumerate(
+            zip(self.submobjects, self.entry_sources)
+        ):
+            source = getattr(entry, "source", None)
+            if source is None:
+                source = (
+                    entry_source
+                    if isinstance(entry_source, str)
+                    else mobject_to_text(entry)
+                )
+            kind = getattr(entry, "kind", type(entry).__name__)
+            self.source_index.append((index, kind, start, start + len(source)))
+            sources.append(source)
+            start += len(source) + 1
+        self.source = "\n".join(sources)
+        return self
+
+    def find(self, text: str) -> list[int]:
+        """
+        Looks up the entries whose source contains a string.
+
+        Args:
+            text (str): The string to look for.
+
+        Returns:
+            list[int]: The indices of the matching entries, in order.
+        """
+        starts = [start for _, _, start, _ in self.source_index]
+        found = []
+        position = self.source.find(text)
+        while position != -1:
+            index, _, _, end = self.source_index[
+                bisect.bisect_right(starts, position) - 1
+            ]
+            if position + len(text) <= end and found[-1:] != [index]:
+                found.append(index)
+            position = self.source.find(text, position + 1)
+        return found
+
+    def get_memory_usage(self) -> int:
+        """
+        Returns the point-array bytes held by all entries of the notebook.
+
+        Returns:
+            int: The total size of all point arrays, in bytes.
+        """
+        return get_point_bytes(self)
+
+    def memory_report(self) -> list[tuple[int, str, int]]:
+        """
+        Reports the point-array bytes held by each entry of the notebook.
+
+        Returns:
+            list[tuple[int, str, int]]: ``(index, class name, bytes)`` per entry.
+        """
+        return memory_report(self)
+
+    def enforce_memory_budget(self, camera: Camera | None = None) -> list[int]:
+        """
+        Drops entries that are off-screen or faded until the notebook fits its budget.
+
+        Dropped entries keep only their source string and bounding box, and the
+        largest ones are dropped first. Entries that were not built from a string
+        are never dropped.
+
+        Args:
+            camera (Camera | None): The camera used to decide what is off-screen.
+                Defaults to the current config.
+
+        Returns:
+            list[int]: The indices of the entries that were dropped.
+        """
+        if self.memory_budget is None:
+            return []
+        usage = self.get_memory_usage()
+        dropped = []
+        for index, _, size in sorted(self.memory_report(), key=lambda e: -e[2]):
+            if usage <= self.memory_budget:
+                break
+            entry = self.submobjects[index]
+            source = self.entry_sources[index]
+            if source is None or getattr(entry, "dropped_source", None) is not None:
+                continue
+            if is_visible(entry, camera):
+                continue
+            drop_to_source(entry, source)
+            usage -= size - get_point_bytes(entry)
+            dropped.append(index)
+        return dropped
+
+    def restore_entries(self, *indices: int) -> Self:
+        """
+        Rebuilds dropped entries from their source strings.
+
+        Args:
+            *indices (int): The entries to restore. Defaults to all dropped entries.
+
+        Returns:
+            Self: The notebook.
+        """
+        for index in indices or range(len(self.submobjects)):
+            restore_from_source(self.submobjects[index])
+        return self
+
     def arrange_notebook(
         self,
         direction: Vector3D = RIGHT,
@@ -94,6 +233,8 @@ class cue_column_MathTex(MathTex):
 
 
 class cue_column(Text):
+    kind = "cue_column"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -0,0 +1,387 @@
+import re
+import functools
+from typing import Sequence
+from manim import logger
+
+"""
+This module provides a fast, pure-Python pre-flight check for TeX strings so
+that malformed input fails before a xelatex/latex subprocess is started, and a
+normalization step so that cosmetic variants of one expression compile once.
+"""
+
+
+class TexValidationError(ValueError):
+    """
+    Raised when a TeX string is rejected by :func:`validate_tex`.
+
+    Args:
+        message (str): What is wrong with the TeX string.
+        tex (str): The TeX string that was checked.
+        position (int | None): Offset of the offending token, if known.
+    """
+
+    def __init__(self, message: str, tex: str = "", position: int | None = None):
+        self.tex = tex
+        self.position = position
+        if position is not None:
+            start = max(position - 20, 0)
+            context = tex[start : position + 20].replace("\n", " ")
+            message = f"{message} at offset {position}: ...{context}..."
+        super().__init__(message)
+
+
+# Commands always available in a LaTeX2e document (text and math mode).
+_CORE_COMMANDS = """
+begin end item label ref eqref pageref cite footnote par newline linebreak
+pagebreak newpage clearpage hspace vspace hfill vfill quad qquad enspace
+thinspace negthinspace medspace thickspace noindent indent centering
+raggedright raggedleft hline cline textbf textit texttt textrm textsf textsc
+textsl textmd textup textnormal textsuperscript textsubscript emph underline
+bfseries itshape ttfamily rmfamily sffamily scshape slshape mdseries upshape
+normalfont tiny scriptsize footnotesize small normalsize large Large LARGE
+huge Huge mbox makebox fbox framebox parbox raisebox rule phantom hphantom
+vphantom smash text textstyle displaystyle scriptstyle scriptscriptstyle
+mathrm mathbf mathit mathsf mathtt mathcal mathnormal mathversion boldmath
+unboldmath frac over atop choose sqrt root of left right middle big Big bigg
+Bigg bigl bigr Bigl Bigr biggl biggr Biggl Biggr bigm Bigm limits nolimits
+sum prod coprod int oint bigcup bigcap bigsqcup bigvee bigwedge bigodot
+bigotimes bigoplus biguplus lim limsup liminf sup inf max min det gcd Pr exp
+log ln lg sin cos tan cot sec csc arcsin arccos arctan sinh cosh tanh coth
+arg deg dim hom ker mod bmod pmod alpha beta gamma delta epsilon varepsilon
+zeta eta theta vartheta iota kappa lambda mu nu xi pi varpi rho varrho sigma
+varsigma tau upsilon phi varphi chi psi omega Gamma Delta Theta Lambda Xi Pi
+Sigma Upsilon Phi Psi Omega pm mp times div cdot ast star circ bullet cap cup
+uplus sqcap sqcup vee wedge setminus wr diamond bigtriangleup bigtriangledown
+triangleleft triangleright oplus ominus otimes oslash odot bigcirc dagger
+ddagger amalg leq le geq ge equiv models prec succ sim perp preceq succeq
+simeq mid ll gg asymp parallel subset supset approx bowtie subseteq supseteq
+cong neq ne smile sqsubseteq sqsupseteq doteq frown in ni notin propto vdash
+dashv not leftarrow rightarrow to gets uparrow downarrow leftrightarrow
+updownarrow Leftarrow Rightarrow Uparrow Downarrow Leftrightarrow
+Updownarrow longleftarrow longrightarrow longleftrightarrow Longleftarrow
+Longrightarrow Longleftrightarrow mapsto longmapsto hookleftarrow
+hookrightarrow leftharpoonup leftharpoondown rightharpoonup rightharpoondown
+rightleftharpoons nearrow searrow swarrow nwarrow iff implies impliedby
+aleph hbar imath jmath ell wp Re Im partial infty prime emptyset nabla
+surd top bot angle forall exists neg lnot flat natural sharp backslash
+clubsuit diamondsuit heartsuit spadesuit ldots cdots vdots ddots dots
+dotsc dotsb dotsm dotsi dotso lbrace rbrace langle rangle lceil rceil lfloor
+rfloor vert Vert lvert rvert lVert rVert hat check breve acute grave tilde
+bar vec dot ddot widehat widetilde overline underline overbrace underbrace
+overrightarrow overleftarrow stackrel buildrel mathop mathbin mathrel mathord
+mathopen mathclose mathpunct operatorname S P dag ddag copyright pounds
+textbackslash textasciitilde textasciicircum textbar textless textgreater
+today LaTeX TeX protect relax ensuremath color textcolor colorbox
+setlength addtolength baselineskip arraycolsep arraystretch tabcolsep
+renewcommand newcommand providecommand def let hbox vbox kern mkern mskip
+hskip vskip strut mathstrut space nobreakspace nolinebreak nopagebreak
+bf rm it sf tt sl sc em cal mit hfil hfilneg hss vfil vss enskip qquad
+colon lbrack rbrack lq rq AA aa AE ae OE oe O o L l i j ss SS dh DH th TH
+ng NG textregistered texttrademark textdagger textsection textparagraph
+textendash textemdash textquoteleft textquoteright textquotedblleft
+textquotedblright textperiodcentered textbullet textellipsis ldotp cdotp
+lhook rhook joinrel relbar Relbar mapstochar owns Join lhd rhd unlhd unrhd
+sqsubset sqsupset leadsto Box Diamond mathellipsis vec widehat overleftarrow
+underleftarrow underrightarrow skew mathchoice mathchar mathcode
+displaylimits nonscript penalty allowbreak discretionary hyphenation
+""".split()
+
+# Commands contributed by the packages the plugin's templates load.
+_PACKAGE_COMMANDS = {
+    "amsmath": """
+        dfrac tfrac cfrac binom dbinom tbinom genfrac boxed intertext
+        shortintertext tag notag nonumber numberwithin eqref substack
+        sideset overset underset xleftarrow xrightarrow iint iiint iiiint idotsint
+        DeclareMathOperator operatorname text lvert rvert lVert rVert
+        allowdisplaybreaks displaybreak hdotsfor mathring varGamma varDelta
+        varTheta varLambda varXi varPi varSigma varUpsilon varPhi varPsi
+        varOmega dddot ddddot overleftrightarrow underleftrightarrow
+        underleftarrow underrightarrow xleftrightarrow xLeftarrow xRightarrow
+        boldsymbol pmb operatornamewithlimits injlim projlim varinjlim
+        varprojlim varliminf varlimsup dotsc dotsb dotsm dotsi dotso
+        mathbf mathrm lvert rvert leftroot uproot smash accentedsymbol
+        Hat Check Tilde Acute Grave Dot Ddot Breve Bar Vec
+    """,
+    "amssymb": """
+        mathbb mathfrak ulcorner urcorner llcorner lrcorner dashrightarrow
+        dashleftarrow dasharrow rightleftharpoons leftrightharpoons angle
+        sqsubset sqsupset lhd rhd unlhd unrhd Join Box Diamond leadsto mho
+        dotplus smallsetminus Cap doublecap Cup doublecup barwedge veebar
+        doublebarwedge boxminus boxtimes boxdot boxplus divideontimes ltimes
+        rtimes leftthreetimes rightthreetimes curlywedge curlyvee circleddash
+        circledast circledcirc centerdot intercal leqq leqslant eqslantless
+        lesssim lessapprox approxeq lessdot lll llless lessgtr lesseqgtr
+        lesseqqgtr doteqdot Doteq risingdotseq fallingdotseq backsim backsimeq
+        subseteqq Subset preccurlyeq curlyeqprec precsim precapprox
+        vartriangleleft trianglelefteq vDash Vvdash smallsmile smallfrown
+        bumpeq Bumpeq geqq geqslant eqslantgtr gtrsim gtrapprox gtrdot ggg
+        gggtr gtrless gtreqless gtreqqless eqcirc circeq triangleq thicksim
+        thickapprox supseteqq Supset succcurlyeq curlyeqsucc succsim
+        succapprox vartriangleright trianglerighteq Vdash shortmid
+        shortparallel between pitchfork varpropto blacktriangleleft therefore
+        backepsilon blacktriangleright because nless lneq lneqq lvertneqq
+        lnsim lnapprox nprec npreceq precneqq precnsim precnapprox nsim
+        nshortmid nmid nvdash nvDash ntriangleleft ntrianglelefteq nsubseteq
+        subsetneq varsubsetneq subsetneqq varsubsetneqq ngtr ngeq ngeqslant
+        ngeqq gneq gneqq gvertneqq gnsim gnapprox nsucc nsucceq succneqq
+        succnsim succnapprox ncong nshortparallel nparallel nVdash nVDash
+        ntriangleright ntrianglerighteq nsupseteq nsupseteqq supsetneq
+        varsupsetneq supsetneqq varsupsetneqq nleq nleqslant nleqq nsubseteqq
+        leftleftarrows leftrightarrows Lleftarrow twoheadleftarrow
+        leftarrowtail looparrowleft curvearrowleft circlearrowleft Lsh
+        upuparrows upharpoonleft downharpoonleft multimap leftrightsquigarrow
+        rightrightarrows rightleftarrows Rrightarrow twoheadrightarrow
+        rightarrowtail looparrowright curvearrowright circlearrowright Rsh
+        downdownarrows upharpoonright downharpoonright restriction
+        rightsquigarrow nleftarrow nrightarrow nLeftarrow nRightarrow
+        nleftrightarrow nLeftrightarrow hslash Bbbk square blacksquare
+        circledS vartriangle blacktriangle complement Game triangledown
+        blacktriangledown lozenge blacklozenge bigstar measuredangle
+        sphericalangle diagup diagdown backprime nexists Finv varnothing eth
+        beth gimel daleth digamma varkappa checkmark maltese yen circledR
+        lozenge triangle
+    """,
+    "cancel": "cancel bcancel xcancel cancelto",
+    "fontspec": """
+        setmainfont setsansfont setmonofont newfontfamily fontspec addfontfeatures
+        defaultfontfeatures
+    """,
+    "polyglossia": """
+        setmainlanguage setotherlanguage setotherlanguages setdefaultlanguage
+        selectlanguage foreignlanguage texthindi textenglish hindi english
+    """,
+}
+
+_PACKAGE_RE = re.compile(r"\\usepackage(?:\[[^\]]*\])?\{([^}]*)\}")
+_DEFINITION_RE = re.compile(
+    r"\\(?:(?:re)?newcommand|providecommand|DeclareMathOperator)\*?\s*\{?\\([a-zA-Z@]+)"
+    r"|\\def\s*\\([a-zA-Z@]+)"
+    r"|\\newfontfamily\s*\{?\\([a-zA-Z@]+)"
+)
+_TOKEN_RE = re.compile(r"\\(?:[a-zA-Z@]+\*?|.)|[{}$%\n]", re.DOTALL)
+_ENVIRONMENT_RE = re.compile(r"\s*\{([^{}]*)\}")
+# The body of these is passed through as is, so it is not checked.
+_VERBATIM_ENVIRONMENTS = frozenset(
+    ["verbatim", "verbatim*", "Verbatim", "Verbatim*", "lstlisting", "minted"]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def command_table(preamble: str) -> frozenset[str] | None:
+    """
+    Builds the set of commands available for a given template preamble.
+
+    The table is cached per preamble, so it is only built once per template.
+
+    Args:
+        preamble (str): The preamble of the TeX template.
+
+    Returns:
+        frozenset[str] | None: Known command names (without the backslash), or
+        None if the preamble loads a package whose commands are not known, in
+        which case unknown commands cannot be detected reliably.
+    """
+    commands = set(_CORE_COMMANDS)
+    for packages in _PACKAGE_RE.findall(preamble):
+        for package in packages.split(","):
+            package = package.strip()
+            if package not in _PACKAGE_COMMANDS:
+                return None
+            commands.update(_PACKAGE_COMMANDS[package].split())
+    for match in _DEFINITION_RE.findall(preamble):
+        commands.update(name for name in match if name)
+    return frozenset(commands)
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_unknown_command(command: str, tex: str) -> None:
+    # The command table cannot list everything TeX knows, so unknown commands
+    # are only reported, once per command and string.
+    logger.warning(f"Possibly unknown TeX command {command} in {tex!r}")
+
+
+def validate_tex(
+    tex_strings: str | Sequence[str],
+    tex_template=None,
+    arg_separator: str = "",
+) -> str:
+    """
+    Checks a TeX string for balanced braces, ``$`` delimiters and environments
+    without calling TeX. Commands missing from the template's command table are
+    logged as warnings, never rejected. The contents of ``\\verb`` and of
+    verbatim-like environments are not checked.
+
+    Args:
+        tex_strings (str | Sequence[str]): The TeX string or fragments to check.
+        tex_template (TexTemplate | None): Template used for the unknown-command
+            warning. If None, unknown commands are not checked.
+        arg_separator (str): The separator used to join the fragments.
+
+    Returns:
+        str: The joined TeX string.
+
+    Raises:
+        TypeError: If a fragment is not a string.
+        TexValidationError: If the TeX string is malformed.
+
+    Example:
+        validate_tex([r"\\textbf{Hello", "World}"])
+    """
+    if isinstance(tex_strings, str):
+        tex_strings = (tex_strings,)
+    for fragment in tex_strings:
+        if not isinstance(fragment, str):
+            raise TypeError(
+                f"TeX fragments must be str, got {type(fragment).__name__}: {fragment!r}"
+            )
+    tex = arg_separator.join(tex_strings)
+
+    known = command_table(tex_template.preamble) if tex_template is not None else None
+    braces = []
+    environments = []
+    dollar_position = None
+    in_comment = False
+    verbatim_end = 0
+    for token in _TOKEN_RE.finditer(tex):
+        value = token.group()
+        if token.start() < verbatim_end:
+            continue
+        if in_comment:
+            in_comment = value != "\n"
+            continue
+        match value:
+            case "%":
+                in_comment = True
+            case "{":
+                braces.append(token.start())
+            case "}":
+                if not braces:
+                    raise TexValidationError("Unmatched '}'", tex, token.start())
+                braces.pop()
+            case "$":
+                dollar_position = None if dollar_position is not None else token.start()
+            case "\\verb" | "\\verb*":
+                # \verb|...| ends at the next occurrence of its delimiter.
+                end = tex.find(tex[token.end() : token.end() + 1], token.end() + 1)
+                if token.end() >= len(tex) or end == -1:
+                    raise TexValidationError(
+                        f"{value} is never ended", tex, token.start()
+                    )
+                verbatim_end = end + 1
+            case "\\begin" | "\\end":
+                environment = _ENVIRONMENT_RE.match(tex, token.end())
+                if environment is None:
+                    raise TexValidationError(
+                        f"Missing environment name after {value}", tex, token.start()
+                    )
+                name = environment.group(1)
+                if value == "\\begin" and name in _VERBATIM_ENVIRONMENTS:
+                    end = tex.find(f"\\end{{{name}}}", environment.end())
+                    if end == -1:
+                        raise TexValidationError(
+                            f"\\begin{{{name}}} is never ended", tex, token.start()
+                        )
+                    verbatim_end = end + len(f"\\end{{{name}}}")
+                elif value == "\\begin":
+                    environments.append((name, token.start()))
+                elif not environments:
+                    raise TexValidationError(
+                        f"\\end{{{name}}} without \\begin{{{name}}}", tex, token.start()
+                    )
+                elif environments[-1][0] != name:
+                    raise TexValidationError(
+                        f"\\begin{{{environments[-1][0]}}} ended by \\end{{{name}}}",
+                        tex,
+                        token.start(),
+                    )
+                else:
+                    environments.pop()
+            case _ if known is not None and value[1:2].isalpha():
+                if value[1:].rstrip("*") not in known:
+                    _warn_unknown_command(value, tex)
+
+    if braces:
+        raise TexValidationError("Unmatched '{'", tex, braces[-1])
+    if dollar_position is not None:
+        raise TexValidationError("Unmatched '$'", tex, dollar_position)
+    if environments:
+        name, position = environments[-1]
+        raise TexValidationError(f"\\begin{{{name}}} is never ended", tex, position)
+    return tex
+
+
+# Control sequences are matched first, so an escaped character such as \% or
+# the \\ line break is never mistaken for the start of a comment or a group.
+_NORMALIZE_RE = re.compile(
+    r"(?P<command>\\[a-zA-Z@]+|\\.)"
+    r"|(?P<space>\s+)"
+    r"|(?P<script>[\^_])\{(?P<char>[A-Za-z0-9])\}"
+    r"|(?P<comment>%)",
+    re.DOTALL,
+)
+_VERBATIM_RE = re.compile(r"\\verb|\\begin\s*\{(?:[vV]erbatim|lstlisting|minted)")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_tex(tex: str, strip: bool = False) -> str:
+    """
+    Rewrites a TeX string in a canonical form that TeX renders identically.
+
+    Runs of whitespace become one space, or one blank line if they hold a
+    paragraph break, and single-character groups such as ``x^{2}`` become
+    ``x^2``. Strings with comments or verbatim text are returned unchanged,
+    since whitespace is significant there.
+
+    Args:
+        tex (str): The TeX string.
+        strip (bool): Whether to also drop leading and trailing whitespace.
+
+    Returns:
+        str: The normalized TeX string.
+
+    Example:
+        normalize_tex("x^{2}  +   y_{i}")  # "x^2 + y_i"
+    """
+    if _VERBATIM_RE.search(tex):
+        return tex
+    parts = []
+    position = 0
+    for match in _NORMALIZE_RE.finditer(tex):
+        parts.append(tex[position : match.start()])
+        position = match.end()
+        if match["comment"]:
+            return tex
+        if match["space"]:
+            at_edge = match.start() == 0 or match.end() == len(tex)
+            if strip and at_edge:
+                continue
+            parts.append("\n\n" if match["space"].count("\n") > 1 else " ")
+        elif match["script"]:
+            parts.append(match["script"] + match["char"])
+        else:
+            parts.append(match["command"])
+    parts.append(tex[position:])
+    return "".join(parts)
+
+
+def normalize_tex_strings(
+    tex_strings: Sequence[str], arg_separator: str = ""
+) -> tuple[str, ...]:
+    """
+    Normalizes every TeX fragment, keeping the fragments apart.
+
+    Fragments are also stripped when the separator is whitespace, since the
+    separator already puts a space between them.
+
+    Args:
+        tex_strings (Sequence[str]): The TeX fragments. Other values are kept as is.
+        arg_separator (str): The separator used to join the fragments.
+
+    Returns:
+        tuple[str, ...]: The normalized fragments.
+    """
+    strip = bool(arg_separator) and arg_separator.isspace()
+    return tuple(
+        normalize_tex(fragment, strip) if isinstance(fragment, str) else fragment
+        for fragment in tex_strings
+    )